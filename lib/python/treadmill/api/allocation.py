@@ -1,15 +1,11 @@
 """Implementation of allocation API.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 from collections import defaultdict
+import concurrent.futures
+import functools
 import logging
-
-import six
+import time
 
 from treadmill.admin import exc as admin_exceptions
 from treadmill import context
@@ -24,28 +20,61 @@ _DEFAULT_RANK = 100
 _DEFAULT_PARTITION = '_default'
 _DEFAULT_PRIORITY = 1
 
+_ALLOCS_CACHE_TTL = 60  # 1 min
+_ALLOCS_CACHE = {}
+
+_BULK_CHECK_WORKERS = 8
+
+_CAPACITY_ATTRS = ('cpu', 'memory', 'disk', 'partition', 'traits')
+
 
 def _set_auth_resource(cls, resource):
     """Set auth resource name for CRUD methods of the class.
     """
-    for method_name in ['get', 'create', 'update', 'delete']:
+    for method_name in ['get', 'create', 'create_many', 'update', 'delete']:
         method = getattr(cls, method_name, None)
         if method:
             method.auth_resource = resource
 
 
+def _group_allocs_by_tenant(cell_allocs):
+    """Group cell allocations by tenant/allocation name in a single pass.
+    """
+    grouped = defaultdict(list)
+    for alloc in cell_allocs:
+        segments = alloc['_id'].split('/', 2)
+        grouped['/'.join(segments[:2])].append(alloc)
+
+    return grouped
+
+
+def _reservation_list_iter(allocs, cell_allocs):
+    """Yield allocations one by one with reservations attached.
+
+    Only the reservation index is held resident, allocations stream
+    through one at a time.
+    """
+    grouped = _group_allocs_by_tenant(cell_allocs)
+    for alloc in allocs:
+        reservations = grouped.get(alloc['_id'])
+        if reservations:
+            alloc.setdefault('reservations', []).extend(reservations)
+        yield alloc
+
+
 def _reservation_list(allocs, cell_allocs):
     """Combine allocations and reservations into single list.
     """
-    name2alloc = {
-        alloc['_id']: defaultdict(list, alloc)
-        for alloc in allocs
-    }
-    for alloc in cell_allocs:
-        name = '/'.join(alloc['_id'].split('/')[:2])
-        name2alloc[name]['reservations'].append(alloc)
+    return list(_reservation_list_iter(allocs, cell_allocs))
 
-    return list(six.itervalues(name2alloc))
+
+def _parse_rsrc_id(rsrc_id, parts=2):
+    """Split a reservation/assignment resource id into its components.
+
+    Returns (allocation, cell) or (allocation, cell, pattern), parsed
+    once at method entry and threaded through.
+    """
+    return rsrc_id.rsplit('/', parts - 1)
 
 
 def _admin_partition():
@@ -60,6 +89,28 @@ def _admin_cell_alloc():
     return context.GLOBAL.admin.cell_allocation()
 
 
+def _cell_allocations(cell):
+    """Fetch all allocations for the cell in a single LDAP call.
+
+    Results are cached for a short interval, capacity checks on repeated
+    reservation writes against the same cell reuse the cached list. The
+    cache entry is dropped after each reservation write, the TTL only
+    bounds staleness caused by concurrent writers.
+    """
+    now = time.time()
+    cached = _ALLOCS_CACHE.get(cell)
+    if cached is None or now - cached[0] > _ALLOCS_CACHE_TTL:
+        cached = (now, _admin_cell_alloc().list({'cell': cell}))
+        _ALLOCS_CACHE[cell] = cached
+    return cached[1]
+
+
+def _invalidate_cell_allocations(cell):
+    """Drop cached allocations for the cell after a reservation write.
+    """
+    _ALLOCS_CACHE.pop(cell, None)
+
+
 def _partition_get(partition, cell):
     """Calculate free capacity for given partition.
     """
@@ -70,17 +121,39 @@ def _partition_get(partition, cell):
         return {'cpu': '0%', 'memory': '0G', 'disk': '0G', 'limits': []}
 
 
-def _check_capacity(cell, allocation, rsrc):
-    """
+def _check_capacity(cell, allocation, rsrc, old=None):
+    """Check partition capacity for the reservation request.
+
+    ``old`` is the current reservation if the caller already has it, when
+    not provided it is resolved from the cached cell allocations and
+    returned, so callers reuse it instead of issuing another LDAP get.
     """
     partition = rsrc['partition']
-    allocs = _admin_cell_alloc().list({'cell': cell, 'partition': partition})
-    part_obj = _partition_get(partition, cell)
+    cell_allocs = _cell_allocations(cell)
     old_id = '{0}/{1}'.format(allocation, cell)
+    if old is None:
+        old = next(
+            (alloc for alloc in cell_allocs if alloc['_id'] == old_id),
+            None
+        )
+
+    allocs = [
+        alloc
+        for alloc in cell_allocs
+        if alloc.get('partition') == partition
+    ]
+    part_obj = _partition_get(partition, cell)
+
+    # parse requested capacity once, it is checked against every limit
+    requested = {
+        'cpu': utils.cpu_units_cached(rsrc['cpu']),
+        'disk': utils.size_to_bytes_cached(rsrc['disk']),
+        'memory': utils.size_to_bytes_cached(rsrc['memory']),
+    }
 
     # check overall allocation limit first
     free_overall = _calc_free(part_obj, allocs, old_id)
-    _check_limit(free_overall, rsrc)
+    _check_limit(free_overall, requested)
 
     # get applicable allocation limits by trait
     limits = [
@@ -94,23 +167,27 @@ def _check_capacity(cell, allocation, rsrc):
     for limit in limits:
         _check_limit(
             free_by_trait[limit['trait']],
-            rsrc,
+            requested,
             ' (trait: %s)' % limit['trait']
         )
 
+    return old
 
-def _check_limit(limit, request, extra_info=''):
+
+def _check_limit(limit, requested, extra_info=''):
     """Check capacity limit for reqested allocation.
+
+    Requested capacity is already parsed into units.
     """
-    if utils.cpu_units(request['cpu']) > limit['cpu']:
+    if requested['cpu'] > limit['cpu']:
         raise exc.InvalidInputError(
             __name__, 'Not enough cpu capacity in partition.' + extra_info)
 
-    if utils.size_to_bytes(request['disk']) > limit['disk']:
+    if requested['disk'] > limit['disk']:
         raise exc.InvalidInputError(
             __name__, 'Not enough disk capacity in partition.' + extra_info)
 
-    if utils.size_to_bytes(request['memory']) > limit['memory']:
+    if requested['memory'] > limit['memory']:
         raise exc.InvalidInputError(
             __name__, 'Not enough memory capacity in partition.' + extra_info)
 
@@ -120,22 +197,24 @@ def _calc_free(limit, allocs, old_id):
 
     Note: allocation with old_id is not counted.
     """
-    free = {
-        'cpu': utils.cpu_units(limit['cpu']),
-        'disk': utils.size_to_bytes(limit['disk']),
-        'memory': utils.size_to_bytes(limit['memory']),
-    }
+    # bind as locals, the loop body is the hot path
+    cpu_units = utils.cpu_units_cached
+    size_to_bytes = utils.size_to_bytes_cached
+
+    free_cpu = cpu_units(limit['cpu'])
+    free_disk = size_to_bytes(limit['disk'])
+    free_memory = size_to_bytes(limit['memory'])
 
     for alloc in allocs:
         # skip allocation with old_id
         if alloc['_id'] == old_id:
             continue
 
-        free['cpu'] -= utils.cpu_units(alloc['cpu'])
-        free['disk'] -= utils.size_to_bytes(alloc['disk'])
-        free['memory'] -= utils.size_to_bytes(alloc['memory'])
+        free_cpu -= cpu_units(alloc['cpu'])
+        free_disk -= size_to_bytes(alloc['disk'])
+        free_memory -= size_to_bytes(alloc['memory'])
 
-    return free
+    return {'cpu': free_cpu, 'disk': free_disk, 'memory': free_memory}
 
 
 def _calc_free_traits(limits, allocs, old_id):
@@ -146,9 +225,9 @@ def _calc_free_traits(limits, allocs, old_id):
     free = {}
     for limit in limits:
         free[limit['trait']] = {
-            'cpu': utils.cpu_units(limit['cpu']),
-            'disk': utils.size_to_bytes(limit['disk']),
-            'memory': utils.size_to_bytes(limit['memory']),
+            'cpu': utils.cpu_units_cached(limit['cpu']),
+            'disk': utils.size_to_bytes_cached(limit['disk']),
+            'memory': utils.size_to_bytes_cached(limit['memory']),
         }
 
     for alloc in allocs:
@@ -158,19 +237,19 @@ def _calc_free_traits(limits, allocs, old_id):
 
         for trait in alloc['traits']:
             if trait in free:
-                free[trait]['cpu'] -= utils.cpu_units(alloc['cpu'])
-                free[trait]['disk'] -= utils.size_to_bytes(alloc['cpu'])
-                free[trait]['memory'] -= utils.size_to_bytes(alloc['cpu'])
+                free[trait]['cpu'] -= utils.cpu_units_cached(alloc['cpu'])
+                free[trait]['disk'] -= utils.size_to_bytes_cached(
+                    alloc['cpu'])
+                free[trait]['memory'] -= utils.size_to_bytes_cached(
+                    alloc['cpu'])
 
     return free
 
 
-def _api_plugins(plugins):
-    """Return api  plugins.
+@functools.lru_cache(maxsize=None)
+def _load_api_plugins(plugins):
+    """Load api plugins for the given plugin names.
     """
-    if not plugins:
-        return []
-
     plugins_ns = 'treadmill.api.allocation.plugins'
     return [
         plugin_manager.load(plugins_ns, name)
@@ -178,10 +257,250 @@ def _api_plugins(plugins):
     ]
 
 
+def _api_plugins(plugins):
+    """Return api  plugins.
+    """
+    if not plugins:
+        return []
+
+    return _load_api_plugins(tuple(sorted(plugins)))
+
+
+class _ReservationAPI:
+    """Reservation API.
+    """
+
+    def __init__(self, plugins=None):
+
+        self._plugins = _api_plugins(plugins)
+
+        @schema.schema({'$ref': 'reservation.json#/resource_id'})
+        def get(rsrc_id):
+            """Get reservation configuration.
+            """
+            allocation, cell = _parse_rsrc_id(rsrc_id)
+            inst = _admin_cell_alloc().get([cell, allocation])
+            if inst is None:
+                return inst
+
+            for plugin in self._plugins:
+                inst = plugin.remove_attributes(inst)
+
+            return inst
+
+        @schema.schema(
+            {'$ref': 'reservation.json#/resource_id'},
+            schema.merged_ref('reservation.json#/resource',
+                              'reservation.json#/verbs/create')
+        )
+        def create(rsrc_id, rsrc):
+            """Create reservation.
+            """
+            allocation, cell = _parse_rsrc_id(rsrc_id)
+            if 'partition' not in rsrc:
+                rsrc['partition'] = _DEFAULT_PARTITION
+            _check_capacity(cell, allocation, rsrc)
+            if 'rank' not in rsrc:
+                rsrc['rank'] = _DEFAULT_RANK
+
+            for plugin in self._plugins:
+                rsrc = plugin.add_attributes(rsrc_id, rsrc)
+
+            admin_cell_alloc = _admin_cell_alloc()
+            admin_cell_alloc.create([cell, allocation], rsrc)
+            _invalidate_cell_allocations(cell)
+            return admin_cell_alloc.get(
+                [cell, allocation], dirty=True
+            )
+
+        @schema.schema(
+            {'$ref': 'reservation.json#/resource_id'},
+            schema.merged_ref('reservation.json#/resource',
+                              'reservation.json#/verbs/create')
+        )
+        def update(rsrc_id, rsrc):
+            """Update reservation.
+
+            The capacity check is skipped when none of the capacity
+            attributes change, e.g. on rank or assignment updates.
+            """
+            allocation, cell = _parse_rsrc_id(rsrc_id)
+            admin_cell_alloc = _admin_cell_alloc()
+
+            # The write base must be fresh, merging into a cached entry
+            # would build on values up to a TTL stale and mutate the
+            # cache in place. The cached allocations are only consulted
+            # inside the capacity check, with this entry passed as old.
+            cell_alloc = admin_cell_alloc.get(
+                [cell, allocation], dirty=True
+            )
+            _LOGGER.debug('Old reservation: %r', cell_alloc)
+
+            if any(rsrc.get(attr) != cell_alloc.get(attr)
+                   for attr in _CAPACITY_ATTRS):
+                _check_capacity(cell, allocation, rsrc, old=cell_alloc)
+
+            cell_alloc.update(rsrc)
+            _LOGGER.debug('New reservation: %r', cell_alloc)
+
+            admin_cell_alloc.update([cell, allocation], cell_alloc)
+            _invalidate_cell_allocations(cell)
+            return cell_alloc
+
+        @schema.schema({'$ref': 'reservation.json#/resource_id'})
+        def delete(rsrc_id):
+            """Delete reservation.
+            """
+            allocation, cell = _parse_rsrc_id(rsrc_id)
+            deleted = _admin_cell_alloc().delete([cell, allocation])
+            _invalidate_cell_allocations(cell)
+            return deleted
+
+        def create_many(items):
+            """Create multiple reservations.
+
+            ``items`` is a list of (rsrc_id, rsrc) tuples. Capacity
+            checks are read-only and independent across cells, so they
+            are fanned out first, warming the per-cell allocation cache;
+            creation is applied only after every check passed.
+            """
+            prepared = []
+            for rsrc_id, rsrc in items:
+                allocation, cell = _parse_rsrc_id(rsrc_id)
+                if 'partition' not in rsrc:
+                    rsrc['partition'] = _DEFAULT_PARTITION
+                prepared.append((rsrc_id, rsrc, allocation, cell))
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_BULK_CHECK_WORKERS) as executor:
+                checks = [
+                    executor.submit(_check_capacity, cell, allocation, rsrc)
+                    for _rsrc_id, rsrc, allocation, cell in prepared
+                ]
+                for check in checks:
+                    check.result()
+
+            # Dispatch through the instance attribute: authz/journal
+            # wrappers replace it, so each reservation is authorized
+            # individually even when create_many is called directly.
+            return [
+                self.create(rsrc_id, rsrc)
+                for rsrc_id, rsrc, _allocation, _cell in prepared
+            ]
+
+        self.get = get
+        self.create = create
+        self.create_many = create_many
+        self.update = update
+        self.delete = delete
+
+        # Must be called last when all methods are set.
+        _set_auth_resource(self, 'reservation')
+
+
+class _AssignmentAPI:
+    """Assignment API.
+    """
+
+    def __init__(self):
+
+        @schema.schema({'$ref': 'assignment.json#/resource_id'})
+        def get(rsrc_id):
+            """Get assignment configuration.
+            """
+            # FIXME: Pattern is ignored, returns all cell assignments.
+            allocation, cell, _pattern = _parse_rsrc_id(rsrc_id, 3)
+            return _admin_cell_alloc().get(
+                [cell, allocation]).get('assignments', [])
+
+        @schema.schema(
+            {'$ref': 'assignment.json#/resource_id'},
+            schema.merged_ref('assignment.json#/resource',
+                              'assignment.json#/verbs/create')
+        )
+        def create(rsrc_id, rsrc):
+            """Create assignment.
+            """
+            allocation, cell, pattern = _parse_rsrc_id(rsrc_id, 3)
+            priority = rsrc.get('priority', _DEFAULT_PRIORITY)
+            admin_cell_alloc = _admin_cell_alloc()
+            admin_cell_alloc.create(
+                [cell, allocation],
+                {'assignments': [{'pattern': pattern,
+                                  'priority': priority}]}
+            )
+            return admin_cell_alloc.get(
+                [cell, allocation], dirty=True
+            ).get('assignments', [])
+
+        @schema.schema(
+            {'$ref': 'assignment.json#/resource_id'},
+            schema.merged_ref('assignment.json#/resource',
+                              'assignment.json#/verbs/update')
+        )
+        def update(rsrc_id, rsrc):
+            """Update assignment.
+            """
+            admin_cell_alloc = _admin_cell_alloc()
+
+            allocation, cell, pattern = _parse_rsrc_id(rsrc_id, 3)
+            priority = rsrc.get('priority', _DEFAULT_PRIORITY)
+
+            assignments = admin_cell_alloc.get(
+                [cell, allocation], dirty=True
+            ).get('assignments', [])
+
+            assignment_attrs = {'priority': priority}
+            for assignment in assignments:
+                if assignment['pattern'] == pattern:
+                    assignment.update(assignment_attrs)
+                    break
+            else:
+                assignments.append(
+                    {'pattern': pattern, 'priority': priority}
+                )
+
+            admin_cell_alloc.update(
+                [cell, allocation],
+                {'assignments': assignments}
+            )
+            return assignments
+
+        @schema.schema({'$ref': 'assignment.json#/resource_id'})
+        def delete(rsrc_id):
+            """Delete assignment.
+            """
+            admin_cell_alloc = _admin_cell_alloc()
+
+            allocation, cell, pattern = _parse_rsrc_id(rsrc_id, 3)
+
+            assignments = admin_cell_alloc.get(
+                [cell, allocation], dirty=True
+            ).get('assignments', [])
+
+            new_assignments = [
+                assignment
+                for assignment in assignments
+                if assignment['pattern'] != pattern
+            ]
+
+            admin_cell_alloc.update(
+                [cell, allocation],
+                {'assignments': new_assignments}
+            )
+
+        self.get = get
+        self.create = create
+        self.update = update
+        self.delete = delete
+
+        # Must be called last when all methods are set.
+        _set_auth_resource(self, 'assignment')
+
+
 class API:
     """Treadmill Allocation REST api.
     """
-    # pylint: disable=too-many-statements
 
     def __init__(self, plugins=None):
 
@@ -195,18 +514,27 @@ class API:
             """
             return context.GLOBAL.admin.tenant()
 
-        def _list(tenant_id=None):
+        def _list(tenant_id=None, generator=False):
             """List allocations.
+
+            With generator=True, returns an iterator over allocations
+            rather than materializing the combined list.
             """
             if tenant_id is None:
                 admin_alloc = _admin_alloc()
                 admin_cell_alloc = _admin_cell_alloc()
-                return _reservation_list(admin_alloc.list({}),
-                                         admin_cell_alloc.list({}))
+                result = _reservation_list_iter(admin_alloc.list({}),
+                                                admin_cell_alloc.list({}))
             else:
                 admin_tnt = _admin_tnt()
-                return _reservation_list(admin_tnt.allocations(tenant_id),
-                                         admin_tnt.reservations(tenant_id))
+                result = _reservation_list_iter(
+                    admin_tnt.allocations(tenant_id),
+                    admin_tnt.reservations(tenant_id)
+                )
+
+            if generator:
+                return result
+            return list(result)
 
         @schema.schema({'$ref': 'allocation.json#/resource_id'})
         def get(rsrc_id):
@@ -215,22 +543,24 @@ class API:
             return _admin_alloc().get(rsrc_id)
 
         @schema.schema({'$ref': 'allocation.json#/resource_id'},
-                       {'allOf': [{'$ref': 'allocation.json#/resource'},
-                                  {'$ref': 'allocation.json#/verbs/create'}]})
+                       schema.merged_ref('allocation.json#/resource',
+                                         'allocation.json#/verbs/create'))
         def create(rsrc_id, rsrc):
             """Create allocation.
             """
-            _admin_alloc().create(rsrc_id, rsrc)
-            return _admin_alloc().get(rsrc_id, dirty=True)
+            admin_alloc = _admin_alloc()
+            admin_alloc.create(rsrc_id, rsrc)
+            return admin_alloc.get(rsrc_id, dirty=True)
 
         @schema.schema({'$ref': 'allocation.json#/resource_id'},
-                       {'allOf': [{'$ref': 'allocation.json#/resource'},
-                                  {'$ref': 'allocation.json#/verbs/update'}]})
+                       schema.merged_ref('allocation.json#/resource',
+                                         'allocation.json#/verbs/update'))
         def update(rsrc_id, rsrc):
             """Update allocation.
             """
-            _admin_alloc().update(rsrc_id, rsrc)
-            return _admin_alloc().get(rsrc_id, dirty=True)
+            admin_alloc = _admin_alloc()
+            admin_alloc.update(rsrc_id, rsrc)
+            return admin_alloc.get(rsrc_id, dirty=True)
 
         @schema.schema({'$ref': 'allocation.json#/resource_id'})
         def delete(rsrc_id):
@@ -238,191 +568,14 @@ class API:
             """
             _admin_alloc().delete(rsrc_id)
 
-        class _ReservationAPI:
-            """Reservation API.
-            """
-
-            def __init__(self, plugins=None):
-
-                self._plugins = _api_plugins(plugins)
-
-                @schema.schema({'$ref': 'reservation.json#/resource_id'})
-                def get(rsrc_id):
-                    """Get reservation configuration.
-                    """
-                    allocation, cell = rsrc_id.rsplit('/', 1)
-                    inst = _admin_cell_alloc().get([cell, allocation])
-                    if inst is None:
-                        return inst
-
-                    for plugin in self._plugins:
-                        inst = plugin.remove_attributes(inst)
-
-                    return inst
-
-                @schema.schema(
-                    {'$ref': 'reservation.json#/resource_id'},
-                    {'allOf': [{'$ref': 'reservation.json#/resource'},
-                               {'$ref': 'reservation.json#/verbs/create'}]}
-                )
-                def create(rsrc_id, rsrc):
-                    """Create reservation.
-                    """
-                    allocation, cell = rsrc_id.rsplit('/', 1)
-                    if 'partition' not in rsrc:
-                        rsrc['partition'] = _DEFAULT_PARTITION
-                    _check_capacity(cell, allocation, rsrc)
-                    if 'rank' not in rsrc:
-                        rsrc['rank'] = _DEFAULT_RANK
-
-                    for plugin in self._plugins:
-                        rsrc = plugin.add_attributes(rsrc_id, rsrc)
-
-                    _admin_cell_alloc().create([cell, allocation], rsrc)
-                    return _admin_cell_alloc().get(
-                        [cell, allocation], dirty=True
-                    )
-
-                @schema.schema(
-                    {'$ref': 'reservation.json#/resource_id'},
-                    {'allOf': [{'$ref': 'reservation.json#/resource'},
-                               {'$ref': 'reservation.json#/verbs/create'}]}
-                )
-                def update(rsrc_id, rsrc):
-                    """Update reservation.
-                    """
-                    allocation, cell = rsrc_id.rsplit('/', 1)
-                    _check_capacity(cell, allocation, rsrc)
-                    admin_cell_alloc = _admin_cell_alloc()
-
-                    cell_alloc = admin_cell_alloc.get(
-                        [cell, allocation], dirty=True
-                    )
-                    _LOGGER.debug('Old reservation: %r', cell_alloc)
-
-                    cell_alloc.update(rsrc)
-                    _LOGGER.debug('New reservation: %r', cell_alloc)
-
-                    admin_cell_alloc.update([cell, allocation], cell_alloc)
-                    return cell_alloc
-
-                @schema.schema({'$ref': 'reservation.json#/resource_id'})
-                def delete(rsrc_id):
-                    """Delete reservation.
-                    """
-                    allocation, cell = rsrc_id.rsplit('/', 1)
-                    return _admin_cell_alloc().delete([cell, allocation])
-
-                self.get = get
-                self.create = create
-                self.update = update
-                self.delete = delete
-
-                # Must be called last when all methods are set.
-                _set_auth_resource(self, 'reservation')
-
-        class _AssignmentAPI:
-            """Assignment API.
-            """
-
-            def __init__(self):
-
-                @schema.schema({'$ref': 'assignment.json#/resource_id'})
-                def get(rsrc_id):
-                    """Get assignment configuration.
-                    """
-                    # FIXME: Pattern is ignored, returns all cell assignments.
-                    allocation, cell, _pattern = rsrc_id.rsplit('/', 2)
-                    return _admin_cell_alloc().get(
-                        [cell, allocation]).get('assignments', [])
-
-                @schema.schema(
-                    {'$ref': 'assignment.json#/resource_id'},
-                    {'allOf': [{'$ref': 'assignment.json#/resource'},
-                               {'$ref': 'assignment.json#/verbs/create'}]}
-                )
-                def create(rsrc_id, rsrc):
-                    """Create assignment.
-                    """
-                    allocation, cell, pattern = rsrc_id.rsplit('/', 2)
-                    priority = rsrc.get('priority', _DEFAULT_PRIORITY)
-                    _admin_cell_alloc().create(
-                        [cell, allocation],
-                        {'assignments': [{'pattern': pattern,
-                                          'priority': priority}]}
-                    )
-                    return _admin_cell_alloc().get(
-                        [cell, allocation], dirty=True
-                    ).get('assignments', [])
-
-                @schema.schema(
-                    {'$ref': 'assignment.json#/resource_id'},
-                    {'allOf': [{'$ref': 'assignment.json#/resource'},
-                               {'$ref': 'assignment.json#/verbs/update'}]}
-                )
-                def update(rsrc_id, rsrc):
-                    """Update assignment.
-                    """
-                    admin_cell_alloc = _admin_cell_alloc()
-
-                    allocation, cell, pattern = rsrc_id.rsplit('/', 2)
-                    priority = rsrc.get('priority', _DEFAULT_PRIORITY)
-
-                    assignments = admin_cell_alloc.get(
-                        [cell, allocation], dirty=True
-                    ).get('assignments', [])
-
-                    assignment_attrs = {'priority': priority}
-                    for assignment in assignments:
-                        if assignment['pattern'] == pattern:
-                            assignment.update(assignment_attrs)
-                            break
-                    else:
-                        assignments.append(
-                            {'pattern': pattern, 'priority': priority}
-                        )
-
-                    _admin_cell_alloc().update(
-                        [cell, allocation],
-                        {'assignments': assignments}
-                    )
-                    return assignments
-
-                @schema.schema({'$ref': 'assignment.json#/resource_id'})
-                def delete(rsrc_id):
-                    """Delete assignment.
-                    """
-                    admin_cell_alloc = _admin_cell_alloc()
-
-                    allocation, cell, pattern = rsrc_id.rsplit('/', 2)
-
-                    assignments = admin_cell_alloc.get(
-                        [cell, allocation], dirty=True
-                    ).get('assignments', [])
-
-                    new_assignments = [
-                        assignment
-                        for assignment in assignments
-                        if assignment['pattern'] != pattern
-                    ]
-
-                    _admin_cell_alloc().update(
-                        [cell, allocation],
-                        {'assignments': new_assignments}
-                    )
-
-                self.get = get
-                self.create = create
-                self.update = update
-                self.delete = delete
-
-                # Must be called last when all methods are set.
-                _set_auth_resource(self, 'assignment')
-
         self.list = _list
         self.get = get
         self.create = create
         self.update = update
         self.delete = delete
+        # Sub-APIs are built per instance: authz/journal wrapping
+        # replaces their methods in place, so sharing instances across
+        # API() constructions would leak and stack wrappers. Plugin
+        # loading, the expensive part, stays cached in _api_plugins.
         self.reservation = _ReservationAPI(plugins)
         self.assignment = _AssignmentAPI()
@@ -1,12 +1,8 @@
 """Implementation of app API.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import logging
+import operator
 
 import jsonschema.exceptions
 
@@ -41,7 +37,7 @@ class API:
             """List configured applications."""
             # Do server-side filtering.
             apps = _admin_app().list({'_id': match}, generator=True)
-            return sorted(apps, key=lambda item: item['_id'])
+            return sorted(apps, key=operator.itemgetter('_id'))
 
         @schema.schema({'$ref': 'app.json#/resource_id'})
         def get(rsrc_id):
@@ -52,8 +48,8 @@ class API:
 
         @schema.schema(
             {'$ref': 'app.json#/resource_id'},
-            {'allOf': [{'$ref': 'app.json#/resource'},
-                       {'$ref': 'app.json#/verbs/create'}]}
+            schema.merged_ref('app.json#/resource',
+                              'app.json#/verbs/create')
         )
         def create(rsrc_id, rsrc):
             """Create (configure) application."""
@@ -64,8 +60,8 @@ class API:
 
         @schema.schema(
             {'$ref': 'app.json#/resource_id'},
-            {'allOf': [{'$ref': 'app.json#/resource'},
-                       {'$ref': 'app.json#/verbs/update'}]}
+            schema.merged_ref('app.json#/resource',
+                              'app.json#/verbs/update')
         )
         def update(rsrc_id, rsrc):
             """Update application configuration."""
@@ -76,8 +72,8 @@ class API:
 
         @schema.schema(
             {'$ref': 'app.json#/resource_id'},
-            {'allOf': [{'$ref': 'app.json#/resource'},
-                       {'$ref': 'app.json#/verbs/patch'}]}
+            schema.merged_ref('app.json#/resource',
+                              'app.json#/verbs/patch')
         )
         def patch(rsrc_id, rsrc):
             """Patch application configuration."""
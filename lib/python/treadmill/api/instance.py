@@ -230,35 +230,71 @@ class API:
             """Bulk update instance priorities."""
             _LOGGER.info('update: %r', updates)
 
-            def _process(rsrc):
-                try:
-                    if '_id' not in rsrc:
-                        raise exc.InvalidInputError(
-                            __name__,
-                            'delta is missing _id attribute: {}'.format(rsrc)
-                        )
+            def _validate(rsrc):
+                """Validate a single priority delta."""
+                if '_id' not in rsrc:
+                    raise exc.InvalidInputError(
+                        __name__,
+                        'delta is missing _id attribute: {}'.format(rsrc)
+                    )
 
-                    rsrc_id = rsrc['_id']
-                    if proid != rsrc_id.partition('.')[0]:
-                        raise exc.InvalidInputError(
-                            __name__,
-                            'instance id does not match proid: {} {}'.format(
-                                proid,
-                                rsrc_id
-                            )
+                rsrc_id = rsrc['_id']
+                if proid != rsrc_id.partition('.')[0]:
+                    raise exc.InvalidInputError(
+                        __name__,
+                        'instance id does not match proid: {} {}'.format(
+                            proid,
+                            rsrc_id
                         )
+                    )
 
-                    delta = {rsrc_id: rsrc['priority']}
+                priority = rsrc.get('priority')
+                if not isinstance(priority, int) or not 0 <= priority <= 100:
+                    raise exc.InvalidInputError(
+                        __name__,
+                        'invalid priority: {} {}'.format(rsrc_id, priority)
+                    )
+
+                return rsrc_id, priority
+
+            deltas = {}
+            errors = {}
+            for idx, rsrc in enumerate(updates):
+                try:
+                    rsrc_id, priority = _validate(rsrc)
+                    deltas[rsrc_id] = priority
+                except Exception as err:  # pylint: disable=W0703
+                    errors[idx] = {'_error': {'_id': rsrc.get('_id'),
+                                              'why': str(err)}}
+
+            # Apply all valid deltas in one call: a single scheduler event
+            # instead of one per delta.
+            if deltas:
+                try:
                     masterapi.update_app_priorities(
                         context.GLOBAL.zk.conn,
-                        delta
+                        deltas
                     )
-                    return masterapi.get_app(context.GLOBAL.zk.conn, rsrc_id)
                 except Exception as err:  # pylint: disable=W0703
-                    return {'_error': {'_id': rsrc_id,
-                                       'why': str(err)}}
-
-            return [_process(rsrc) for rsrc in updates]
+                    for idx, rsrc in enumerate(updates):
+                        if idx not in errors:
+                            errors[idx] = {'_error': {'_id': rsrc['_id'],
+                                                      'why': str(err)}}
+
+            results = []
+            for idx, rsrc in enumerate(updates):
+                if idx in errors:
+                    results.append(errors[idx])
+                    continue
+                try:
+                    results.append(
+                        masterapi.get_app(context.GLOBAL.zk.conn,
+                                          rsrc['_id'])
+                    )
+                except Exception as err:  # pylint: disable=W0703
+                    results.append({'_error': {'_id': rsrc['_id'],
+                                               'why': str(err)}})
+            return results
 
         @schema.schema(
             {'$ref': 'instance.json#/resource_id'},
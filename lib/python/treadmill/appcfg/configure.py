@@ -25,6 +25,27 @@ from treadmill import runtime as app_runtime
 _LOGGER = logging.getLogger(__name__)
 
 
+def _copy_manifest(src, dst):
+    """Copy the manifest file with a kernel-side sendfile.
+
+    Falls back to shutil.copyfile where sendfile is unavailable.
+    """
+    if not hasattr(os, 'sendfile'):
+        shutil.copyfile(src, dst)
+        return
+
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        size = os.fstat(src_file.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(
+                dst_file.fileno(), src_file.fileno(), offset, size - offset
+            )
+            if not sent:
+                break
+            offset += sent
+
+
 def load_runtime_manifest(tm_env, event, runtime):
     """load manifest data and modify based on runtime
     :param tm_env:
@@ -155,7 +176,7 @@ def configure(tm_env, event, runtime, runtime_param=None):
 
     # Copy the original event as 'manifest.yml' in the container dir
     try:
-        shutil.copyfile(
+        _copy_manifest(
             event,
             os.path.join(data_dir, 'manifest.yml')
         )
@@ -168,13 +189,12 @@ def configure(tm_env, event, runtime, runtime_param=None):
         else:
             raise
 
-    # Store the app.json in the container directory
+    # Store the app.json in the container directory. The payload is encoded
+    # up front so the write callback is a single write of one buffer.
+    app_json = utils.json_encode(manifest_data)
     fs.write_safe(
         os.path.join(data_dir, appcfg.APP_JSON),
-        lambda f: f.writelines(
-            utils.json_genencode(manifest_data)
-        ),
-        mode='w',
+        lambda f: f.write(app_json),
         permission=0o644
     )
 
@@ -7,7 +7,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import io
-import json
 import logging
 import os
 
@@ -31,7 +30,7 @@ def read(filename, file_format='json'):
     """
     with io.open(filename) as f:
         if file_format == 'json':
-            manifest = json.load(fp=f)
+            manifest = utils.json_decode(f.read())
         else:
             manifest = yaml.load(stream=f)
 
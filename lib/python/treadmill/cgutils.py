@@ -322,13 +322,13 @@ def get_stat(subsystem, cgrp):
     pseudofile = '%s.stat' % subsystem
     stat_str = cgroups.get_data(subsystem, cgrp, pseudofile)
 
-    stat_lines = stat_str.split('\n')
-    stats = {}
-    for stat_line in stat_lines:
-        stat_kv = stat_line.strip().split(' ')
-        stats[stat_kv[0]] = int(stat_kv[1])
-
-    return stats
+    return {
+        key: int(value)
+        for key, _, value in (
+            line.partition(' ') for line in stat_str.splitlines()
+        )
+        if value
+    }
 
 
 def app_cgrp_count(cgroup_prefix):
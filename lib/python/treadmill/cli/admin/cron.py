@@ -6,35 +6,55 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import functools
+import importlib
 import logging
 
 import click
-import pytz
-
-from apscheduler.jobstores import base
 
 from treadmill import cli
 from treadmill import context
-from treadmill import cron
 from treadmill import exc
 
-from treadmill.cron import model as cron_model
-
 
 _LOGGER = logging.getLogger(__name__)
 
-_FORMATTER = cli.make_formatter('cron')
 
-ON_EXCEPTIONS = cli.handle_exceptions([
-    (exc.InvalidInputError, None),
-    (base.JobLookupError, None),
-    (pytz.UnknownTimeZoneError, 'Unknown timezone'),
-])
+@functools.lru_cache(maxsize=None)
+def _cron_mod(name=None):
+    """Import the cron subsystem on first use.
+
+    `treadmill.cron` drags in apscheduler and twisted - too expensive to
+    pay for on every `admin` invocation that never touches cron.
+    """
+    if name:
+        return importlib.import_module('treadmill.cron.' + name)
+    return importlib.import_module('treadmill.cron')
+
+
+@functools.lru_cache(maxsize=None)
+def _on_exceptions():
+    """Build the exception handling decorator, importing lazily."""
+    base = importlib.import_module('apscheduler.jobstores.base')
+    pytz = importlib.import_module('pytz')
+    return cli.handle_exceptions([
+        (exc.InvalidInputError, None),
+        (base.JobLookupError, None),
+        (pytz.UnknownTimeZoneError, 'Unknown timezone'),
+    ])
 
 
 def init():
     """Return top level command handler."""
     ctx = {}
+    formatter = cli.make_formatter('cron')
+
+    def on_exceptions(func):
+        """Defer building the exception handler until the command runs."""
+        @functools.wraps(func)
+        def _wrap(*args, **kwargs):
+            return _on_exceptions()(func)(*args, **kwargs)
+        return _wrap
 
     @click.group()
     @click.option('--cell', required=True,
@@ -44,7 +64,7 @@ def init():
     def cron_group():
         """Manage Treadmill cron jobs"""
         zkclient = context.GLOBAL.zk.conn
-        ctx['scheduler'] = cron.get_scheduler(zkclient)
+        ctx['scheduler'] = _cron_mod().get_scheduler(zkclient)
 
     @cron_group.command()
     @click.argument('job_id')
@@ -56,10 +76,11 @@ def init():
                   required=True)
     @click.option('--count', help='The number of instances to start',
                   type=int)
-    @ON_EXCEPTIONS
+    @on_exceptions
     def configure(job_id, event, resource, expression, count):
         """Create or modify an existing app start schedule"""
         scheduler = ctx['scheduler']
+        cron_model = _cron_mod('model')
 
         job = None
         try:
@@ -71,7 +92,7 @@ def init():
                 scheduler, job_id, event, resource, expression, count
             )
 
-        cli.out(_FORMATTER(cron.job_to_dict(job)))
+        cli.out(formatter(_cron_mod().job_to_dict(job)))
 
     @cron_group.command(name='list')
     def _list():
@@ -80,14 +101,14 @@ def init():
 
         jobs = scheduler.get_jobs()
 
-        job_dicts = [cron.job_to_dict(job) for job in jobs]
+        job_dicts = [_cron_mod().job_to_dict(job) for job in jobs]
         _LOGGER.debug('job_dicts: %r', jobs)
 
-        cli.out(_FORMATTER(job_dicts))
+        cli.out(formatter(job_dicts))
 
     @cron_group.command()
     @click.argument('job_id')
-    @ON_EXCEPTIONS
+    @on_exceptions
     def delete(job_id):
         """Delete an app schedule"""
         scheduler = ctx['scheduler']
@@ -97,7 +118,7 @@ def init():
 
     @cron_group.command()
     @click.argument('job_id')
-    @ON_EXCEPTIONS
+    @on_exceptions
     def pause(job_id):
         """Pause a job ID"""
         scheduler = ctx['scheduler']
@@ -107,7 +128,7 @@ def init():
 
     @cron_group.command()
     @click.argument('job_id')
-    @ON_EXCEPTIONS
+    @on_exceptions
     def resume(job_id):
         """Resume a job ID"""
         scheduler = ctx['scheduler']
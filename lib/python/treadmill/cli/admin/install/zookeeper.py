@@ -11,7 +11,6 @@ import os
 
 import click
 
-from treadmill.bootstrap import install as bs_install
 from treadmill import cli
 from treadmill import context
 from treadmill import sysinfo
@@ -38,6 +37,8 @@ def init():
     @click.pass_context
     def zookeeper(ctx, run, master_id, data_dir, zk_admins):
         """Installs Treadmill master."""
+        # Lazy import - bootstrap is only needed once the command runs.
+        from treadmill.bootstrap import install as bs_install
 
         ctx.obj['PARAMS']['zookeeper'] = context.GLOBAL.zk.url
         ctx.obj['PARAMS']['ldap'] = context.GLOBAL.ldap.url
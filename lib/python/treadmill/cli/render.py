@@ -6,6 +6,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import functools
 import io
 import os
 
@@ -16,6 +17,15 @@ from treadmill import cli
 from treadmill import yamlwrapper as yaml
 
 
+@functools.lru_cache(maxsize=32)
+def _env(directory):
+    """Return cached template environment for the given directory."""
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory),
+        keep_trailing_newline=True
+    )
+
+
 def init():
     """Return top level command handler."""
 
@@ -25,10 +35,7 @@ def init():
                     type=click.Path(exists=True, readable=True))
     def interpolate(inputfile, params):
         """Interpolate input file template."""
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(os.path.dirname(inputfile)),
-            keep_trailing_newline=True
-        )
+        env = _env(os.path.dirname(inputfile))
 
         data = {}
         for param in params:
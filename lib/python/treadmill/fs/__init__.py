@@ -187,8 +187,17 @@ def norm_safe(path):
 def symlink_safe(link, target):
     """Create symlink to target. Atomically rename if link already exists.
     """
-    tmp_link = tempfile.mktemp(prefix='.tmp', dir=os.path.dirname(link))
-    os.symlink(target, tmp_link)
+    # Fixed temp name: each link has a single writer, so no randomness is
+    # needed and the insecure tempfile.mktemp is avoided.
+    tmp_link = os.path.join(
+        os.path.dirname(link), '.tmp' + os.path.basename(link)
+    )
+    try:
+        os.symlink(target, tmp_link)
+    except FileExistsError:
+        # Stale temp link left over from an interrupted run.
+        os.unlink(tmp_link)
+        os.symlink(target, tmp_link)
     replace(tmp_link, link)
 
 
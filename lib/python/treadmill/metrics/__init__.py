@@ -7,13 +7,12 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import errno
+import functools
 import io
 import logging
 import os
 import time
 
-import six
-
 from treadmill import cgroups
 from treadmill import cgutils
 from treadmill import fs
@@ -31,8 +30,8 @@ _LOGGER = logging.getLogger(__name__)
 _SYSPROCS = ['s6-*', 'treadmill_disc*', 'pid1', 'app_tickets', 'app_presence',
              'app_endpoint*']
 
-# yield metrics in chunks of 100
-_METRICS_CHUNK_SIZE = 100
+# read and emit app metrics in chunks of 100
+METRICS_CHUNK_SIZE = 100
 
 
 def read_memory_stats(cgrp):
@@ -47,46 +46,73 @@ def read_memory_stats(cgrp):
     return metric
 
 
-_MEMORY_TYPE = [
-    'memory.failcnt',
+# Limits are set once when the cgroup is configured, so they are safe to
+# cache for the lifetime of the cgroup. Counters change on every read.
+_MEMORY_LIMITS = frozenset([
     'memory.limit_in_bytes',
+    'memory.memsw.limit_in_bytes',
+    'memory.soft_limit_in_bytes',
+])
+
+_MEMORY_COUNTERS = [
+    'memory.failcnt',
     'memory.max_usage_in_bytes',
     'memory.memsw.failcnt',
-    'memory.memsw.limit_in_bytes',
     'memory.memsw.max_usage_in_bytes',
     'memory.memsw.usage_in_bytes',
-    'memory.soft_limit_in_bytes',
     'memory.usage_in_bytes',
 ]
 
+_MEMORY_TYPE = sorted(_MEMORY_COUNTERS + list(_MEMORY_LIMITS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_memory_limit(cgrp, pseudofile):
+    """Memoized read of an immutable memory limit pseudofile.
+
+    Entries for destroyed cgroups are never queried again and age out of
+    the bounded cache.
+    """
+    return cgroups.get_value('memory', cgrp, pseudofile)
+
 
 def cgrp_meminfo(cgrp, *pseudofiles):
     """Grab the cgrp mem limits"""
 
-    if pseudofiles is None or not pseudofiles:
+    if not pseudofiles:
         pseudofiles = _MEMORY_TYPE
 
-    metrics = {}
+    # Counters are read in one batch, resolving the cgroup dir only once.
+    counters = [
+        pseudofile for pseudofile in pseudofiles
+        if pseudofile not in _MEMORY_LIMITS
+    ]
+    metrics = cgroups.get_values('memory', cgrp, counters)
     for pseudofile in pseudofiles:
-        data = cgroups.get_value('memory', cgrp, pseudofile)
-
-        # remove memory. prefix
-        metrics[pseudofile] = data
+        if pseudofile in _MEMORY_LIMITS:
+            metrics[pseudofile] = _cached_memory_limit(cgrp, pseudofile)
 
     return metrics
 
 
+@functools.lru_cache(maxsize=4096)
+def _app_cgroup(cgroup_prefix, appname):
+    """Memoized container cgroup path - stable for a container lifetime."""
+    return os.path.join(cgutils.apps_group_name(cgroup_prefix), appname)
+
+
 def read_psmem_stats(appname, allpids, cgroup_prefix):
     """Reads per-proc memory details stats."""
-    apps_group = cgutils.apps_group_name(cgroup_prefix)
-    cgrp = os.path.join(apps_group, appname)
-    group_pids = set(cgutils.pids_in_cgroup('memory', cgrp))
+    cgrp = _app_cgroup(cgroup_prefix, appname)
+    group_pids = cgutils.pids_in_cgroup('memory', cgrp)
 
     # Intersection of all /proc pids (allpids) and pid in .../tasks will give
     # the set we are interested in.
     #
     # "tasks" contain thread pids that we want to filter out.
-    meminfo = psmem.get_memory_usage(allpids & group_pids, use_pss=True)
+    meminfo = psmem.get_memory_usage(
+        allpids.intersection(group_pids), use_pss=True
+    )
     return meminfo
 
 
@@ -103,7 +129,7 @@ _BLKIO_INFO_TYPE = [
 def read_blkio_info_stats(cgrp, *pseudofiles):
     """Read bklio statistics for the given Treadmill app.
     """
-    if pseudofiles is None or not pseudofiles:
+    if not pseudofiles:
         pseudofiles = _BLKIO_INFO_TYPE
 
     metrics = {}
@@ -124,7 +150,7 @@ _BLKIO_VALUE_TYPE = [
 def read_blkio_value_stats(cgrp, *pseudofiles):
     """ read blkio value based cgroup pseudofiles
     """
-    if pseudofiles is None or not pseudofiles:
+    if not pseudofiles:
         pseudofiles = _BLKIO_VALUE_TYPE
 
     metrics = {}
@@ -141,9 +167,7 @@ def read_load():
     with io.open('/proc/loadavg') as f:
         # /proc/loadavg file format:
         # 1min_avg 5min_avg 15min_avg ...
-        line = f.read()
-        loadavg_1min = line.split()[0]
-        loadavg_5min = line.split()[1]
+        loadavg_1min, loadavg_5min = f.read().split(None, 2)[:2]
 
         return (loadavg_1min, loadavg_5min)
 
@@ -153,10 +177,10 @@ def read_cpuacct_stat(cgrp):
     """
     divided_usage = cgutils.get_stat('cpuacct', cgrp)
     # usage in other file in nanseconds, in cpuaaac.stat is 10 miliseconds
-    for name, value in six.iteritems(divided_usage):
-        divided_usage[name] = value * NANOSECS_PER_10MILLI
-
-    return divided_usage
+    return {
+        name: value * NANOSECS_PER_10MILLI
+        for name, value in divided_usage.items()
+    }
 
 
 def read_cpu_stat(cgrp):
@@ -179,7 +203,9 @@ def read_cpu_stats(cgrp):
     """
     data = {}
     data['cpuacct.usage_percpu'] = cgutils.per_cpu_usage(cgrp)
-    data['cpuacct.usage'] = cgutils.cpu_usage(cgrp)
+    # cpuacct.usage is the sum of the per-cpu counters, derive it rather
+    # than reading another pseudofile.
+    data['cpuacct.usage'] = sum(data['cpuacct.usage_percpu'])
     data['cpuacct.stat'] = read_cpuacct_stat(cgrp)
     data['cpu.stat'] = read_cpu_stat(cgrp)
     data['cpu.shares'] = cgutils.get_cpu_shares(cgrp)
@@ -216,26 +242,22 @@ def app_metrics(cgrp, block_dev):
     """Returns app metrics or empty dict if app not found."""
     result = {}
 
-    try:
-        result['timestamp'] = time.time()
-
-        # merge memory stats into dict
-        memory_stats = read_memory_stats(cgrp)
-        result.update(memory_stats)
-
-        # merge cpu stats into dict
-        cpu_stats = read_cpu_stats(cgrp)
-        result.update(cpu_stats)
+    # Common case: the container just exited and its cgroups are gone. One
+    # stat up front is cheaper than a series of reads all failing ENOENT.
+    if not os.path.isdir(cgroups.makepath('memory', cgrp)):
+        return result
 
-        # merge blkio stats into dict
-        blkio_stats = read_blkio_info_stats(cgrp)
-        result.update(blkio_stats)
-        blkio_stats = read_blkio_value_stats(cgrp)
-        result.update(blkio_stats)
-
-        # merge filesystem stats into dict
-        fs_usage = get_fs_usage(block_dev)
-        result.update(fs_usage)
+    try:
+        # Build the result in a single dict display so it is sized once
+        # instead of regrowing through a series of updates.
+        result = {
+            'timestamp': time.time(),
+            **read_memory_stats(cgrp),
+            **read_cpu_stats(cgrp),
+            **read_blkio_info_stats(cgrp),
+            **read_blkio_value_stats(cgrp),
+            **get_fs_usage(block_dev),
+        }
 
     except OSError as err:
         if err.errno != errno.ENOENT:
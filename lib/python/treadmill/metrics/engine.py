@@ -147,9 +147,15 @@ class CgroupReader:
             name = os.path.basename(app_dir)
             names.append(name)
 
-        snapshot = {
-            name: self.read_app(name) if detail else None
-            for name in names
-        }
+        # Read in fixed-size chunks - nodes can run hundreds of containers
+        # and chunking gives progress visibility on slow cgroup scans.
+        snapshot = {}
+        for idx in range(0, len(names), metrics.METRICS_CHUNK_SIZE):
+            snapshot.update(
+                (name, self.read_app(name) if detail else None)
+                for name in names[idx:idx + metrics.METRICS_CHUNK_SIZE]
+            )
+            _LOGGER.debug('read %d/%d containers', len(snapshot), len(names))
+
         _LOGGER.info('%d containers', len(snapshot))
         return snapshot
@@ -20,6 +20,14 @@ _LOGGER = logging.getLogger(__name__)
 
 _FILTER = None
 
+# Entry points by namespace, built once per namespace to avoid rescanning
+# all installed distributions on every load.
+_ENTRY_POINTS = {}
+
+# Resolved plugins by (namespace, name). Entry points resolve to module
+# level objects (classes, modules), safe to reuse across loads.
+_RESOLVED = {}
+
 
 def _load_plugins():
     """Load plugins."""
@@ -87,40 +95,54 @@ def _match(namespace, name):
     return False
 
 
-def _pkg_resources_names(namespace):
-    """Return extension names without loading the extensions."""
+def _entry_points(namespace):
+    """Return cached entry points for the namespace, keyed by name."""
     import pkg_resources
 
+    cached = _ENTRY_POINTS.get(namespace)
+    if cached is None:
+        cached = collections.OrderedDict(
+            (entry.name, entry)
+            for entry in pkg_resources.iter_entry_points(namespace)
+        )
+        _ENTRY_POINTS[namespace] = cached
+    return cached
+
+
+def _pkg_resources_names(namespace):
+    """Return extension names without loading the extensions."""
     return [
-        entry.name for entry in pkg_resources.iter_entry_points(namespace)
-        if _match(namespace, entry.name)
+        name for name in _entry_points(namespace)
+        if _match(namespace, name)
     ]
 
 
 def _pkg_resources_load(namespace, name):
     """Return loaded module."""
-    import pkg_resources
-
     if not _match(namespace, name):
         # FIXME: Do not overload KeyError
         raise KeyError('Entry point not found: %r:%r' % (namespace, name))
 
-    plugin = next(pkg_resources.iter_entry_points(namespace, name), None)
+    try:
+        return _RESOLVED[(namespace, name)]
+    except KeyError:
+        pass
+
+    plugin = _entry_points(namespace).get(name)
     if plugin is None:
         # FIXME: Do not overload KeyError
         raise KeyError('Entry point not found: %r:%r' % (namespace, name))
 
     instance = plugin.load()
+    _RESOLVED[(namespace, name)] = instance
     return instance
 
 
 def _pkg_resources_load_all(namespace):
     """Load all plugins in the namespace."""
-    import pkg_resources
-
     return [
-        entry.load() for entry in pkg_resources.iter_entry_points(namespace)
-        if _match(namespace, entry.name)
+        entry.load() for name, entry in _entry_points(namespace).items()
+        if _match(namespace, name)
     ]
 
 
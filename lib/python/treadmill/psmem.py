@@ -87,31 +87,31 @@ def get_mem_stats(pid, use_pss=True):
     statm = proc_readline(pid, 'statm').split()
     rss = int(statm[1]) * _PAGESIZE
 
-    private_lines = []
-    shared_lines = []
-    pss_lines = []
     have_pss = False
 
     if use_pss and os.path.exists(proc_path(pid, 'smaps')):
-        for line in proc_readlines(pid, 'smaps'):
-            if line.startswith('Shared'):
-                shared_lines.append(line)
-            elif line.startswith('Private'):
-                private_lines.append(line)
-            elif line.startswith('Pss'):
-                have_pss = True
-                pss_lines.append(line)
-
-        shared = sum([int(line.split()[1]) for line in shared_lines])
-        private = sum([int(line.split()[1]) for line in private_lines])
+        # Accumulate in one pass over the file, smaps can run to
+        # thousands of lines for large processes.
+        shared = 0
+        private = 0
+        pss = 0.0
+        pss_count = 0
+        with proc_open(pid, 'smaps') as smaps:
+            for line in smaps:
+                if line.startswith('Shared'):
+                    shared += int(line.split()[1])
+                elif line.startswith('Private'):
+                    private += int(line.split()[1])
+                elif line.startswith('Pss'):
+                    have_pss = True
+                    pss += float(line.split()[1])
+                    pss_count += 1
 
         # shared + private = rss above
         # the Rss in smaps includes video card mem etc.
         if have_pss:
-            # add 0.5KiB as this avg error due to trunctation
-            pss_adjust = 0.5
-            pss = sum([float(line.split()[1]) + pss_adjust
-                       for line in pss_lines])
+            # add 0.5KiB per line as this avg error due to trunctation
+            pss += 0.5 * pss_count
             shared = pss - private
     else:
         shared = int(statm[2]) * _PAGESIZE
@@ -7,6 +7,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import abc
+import concurrent.futures
 import logging
 import os
 import tornado.httpserver
@@ -26,6 +27,10 @@ FLASK_APP.config['BUNDLE_ERRORS'] = True
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Number of threads serving WSGI requests when tornado supports offloading
+#: them from the ioloop.
+_WSGI_POOL_SIZE = 32
+
 
 class CompliantJsonEncoder(flask.json.JSONEncoder):
     """A JSONEncoder that forces NaN and Infinity into null values.
@@ -72,7 +77,18 @@ class RestServer:
 
         FLASK_APP.config['REST_SERVER'] = self
 
-        container = tornado.wsgi.WSGIContainer(FLASK_APP)
+        # Handlers block on downstream calls (LDAP, zookeeper, ...). Newer
+        # tornado can run the WSGI app on a thread pool so one slow request
+        # does not stall every other request on the ioloop.
+        try:
+            container = tornado.wsgi.WSGIContainer(
+                FLASK_APP,
+                executor=concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_WSGI_POOL_SIZE
+                )
+            )
+        except TypeError:
+            container = tornado.wsgi.WSGIContainer(FLASK_APP)
         http_server = tornado.httpserver.HTTPServer(container)
 
         self._setup_endpoint(http_server)
@@ -11,6 +11,11 @@ import logging
 import flask
 import flask_restplus as restplus
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from treadmill import api as api_mod
 from treadmill import authz
 from treadmill import plugin_manager
@@ -21,6 +26,31 @@ from treadmill.rest import error_handlers
 _LOGGER = logging.getLogger(__name__)
 
 
+def _memoize_model_resolved():
+    """Cache flask_restplus Model.resolved per model.
+
+    Model.resolved deep-copies the full field map on every marshal call,
+    which dominates response time for list endpoints. Treadmill models are
+    built once in each module's init() and not mutated afterwards; the
+    resolution is recomputed only if a model's fields or parents change.
+    """
+    resolve = restplus.model.Model.resolved.fget
+
+    def _resolved(self):
+        """Memoized resolved fields."""
+        key = (tuple(self), len(self.__parents__))
+        cached = self.__dict__.get('_resolved_cache')
+        if cached is None or cached[0] != key:
+            cached = (key, resolve(self))
+            self.__dict__['_resolved_cache'] = cached
+        return cached[1]
+
+    restplus.model.Model.resolved = property(_resolved)
+
+
+_memoize_model_resolved()
+
+
 def base_api(title=None, cors_origin=None):
     """Create base_api object"""
     blueprint = flask.Blueprint('v1', __name__)
@@ -29,6 +59,18 @@ def base_api(title=None, cors_origin=None):
                        title=title,
                        description='Treadmill REST API Documentation')
 
+    if orjson is not None:
+        @api.representation('application/json')
+        def _output_json(data, code, headers=None):
+            """Encode responses with the C JSON encoder when available.
+
+            orjson renders NaN/Infinity as null, matching the behavior of
+            rest.CompliantJsonEncoder.
+            """
+            resp = flask.make_response(orjson.dumps(data), code)
+            resp.headers.extend(headers or {})
+            return resp
+
     error_handlers.register(api)
 
     # load up any external error_handlers
@@ -18,6 +18,20 @@ from treadmill import webutils
 _LOGGER = logging.getLogger(__name__)
 
 
+def _log_response(log):
+    """Build a response from a log query result.
+
+    Implementations may return either a generator of log lines or a path
+    to the log file. A path is served with ``flask.send_file``, which goes
+    through the WSGI file wrapper (``sendfile(2)`` on Linux) and avoids
+    per-line iteration in Python.
+    """
+    if isinstance(log, str):
+        return flask.send_file(log, mimetype='text/plain', conditional=True)
+
+    return flask.Response(log, mimetype='text/plain')
+
+
 def init(api, cors, impl):
     """Configures REST handlers for allocation resource."""
 
@@ -85,14 +99,12 @@ def init(api, cors, impl):
             kwargs = req_parser.parse_args()
 
             if kwargs.get('all'):
-                return flask.Response(
-                    impl.log.get_all(self._to_rsrc_id(app, uniq, component)),
-                    mimetype='text/plain')
+                return _log_response(
+                    impl.log.get_all(self._to_rsrc_id(app, uniq, component)))
 
             del kwargs['all']  # 'all' is always in kwargs...
-            return flask.Response(
-                impl.log.get(self._to_rsrc_id(app, uniq, component), **kwargs),
-                mimetype='text/plain')
+            return _log_response(
+                impl.log.get(self._to_rsrc_id(app, uniq, component), **kwargs))
 
     @app_ns.route('/<app>/<uniq>/service/<service>',)
     class _AppServiceLog(restplus.Resource):
@@ -109,14 +121,12 @@ def init(api, cors, impl):
             kwargs = req_parser.parse_args()
 
             if kwargs.get('all'):
-                return flask.Response(
-                    impl.log.get_all(self._to_rsrc_id(app, uniq, service)),
-                    mimetype='text/plain')
+                return _log_response(
+                    impl.log.get_all(self._to_rsrc_id(app, uniq, service)))
 
             del kwargs['all']  # 'all' is always in kwargs...
-            return flask.Response(
-                impl.log.get(self._to_rsrc_id(app, uniq, service), **kwargs),
-                mimetype='text/plain')
+            return _log_response(
+                impl.log.get(self._to_rsrc_id(app, uniq, service), **kwargs))
 
     archive_ns = api.namespace('archive',
                                description='Local archive REST operations')
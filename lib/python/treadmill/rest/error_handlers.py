@@ -34,6 +34,9 @@ def register(api):
     #       it picks the first handler that can pass isinstance check on error.
     #       It results in unpredictable behavior when registering error handler
     #       for super and subclass at the same time.
+    # The CORS headers echo the caller's Origin and method from the
+    # request environ, so they must be derived per response, inside a
+    # request context.
     def _cors_headers():
         return webutils.cors_make_headers(base_origin='.*',
                                           max_age=21600,
@@ -37,6 +37,14 @@ _LOGGER = logging.getLogger(__name__)
 _ARCHIVE_LIMIT = utils.size_to_bytes('1G')
 _RUNTIME_NAMESPACE = 'treadmill.runtime'
 
+#: Private RNG for port selection, so concurrent launches do not contend on
+#: the module-level random state. Re-seeded after fork so sibling workers
+#: do not draw identical port sequences.
+_PORT_RNG = random.Random()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_PORT_RNG.seed)
+
 if os.name == 'posix':
     # Disable C0413: should be placed at the top of the module.
     from treadmill import iptables  # pylint: disable=c0413
@@ -95,7 +103,8 @@ def load_app(container_dir, app_json=STATE_JSON):
 
     try:
         manifest = app_manifest.read(manifest_file)
-        _LOGGER.debug('Manifest: %r', manifest)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug('Manifest: %r', manifest)
         return utils.to_obj(manifest)
 
     except IOError as err:
@@ -111,12 +120,10 @@ def save_app(manifest, container_dir, app_json=STATE_JSON):
     # Save the manifest with allocated vip and ports in the state
     #
     state_file = os.path.join(container_dir, app_json)
+    state_data = utils.json_encode(manifest)
     fs.write_safe(
         state_file,
-        lambda f: f.writelines(
-            utils.json_genencode(manifest)
-        ),
-        mode='w',
+        lambda f: f.write(state_data),
         # chmod for the file to be world readable.
         permission=0o644
     )
@@ -125,24 +132,37 @@ def save_app(manifest, container_dir, app_json=STATE_JSON):
     return utils.to_obj(manifest)
 
 
-def _allocate_sockets(environment, host_ip, sock_type, count):
-    """Return a list of `count` socket bound to an ephemeral port.
-    """
+def _port_pool(environment):
+    """Candidate host ports for the environment, in natural order."""
     # TODO: this should probably be abstracted away
     if environment in ('uat', 'prod'):
-        port_pool = six.moves.range(PROD_PORT_LOW, PROD_PORT_HIGH + 1)
-    else:
-        port_pool = six.moves.range(NONPROD_PORT_LOW, NONPROD_PORT_HIGH + 1)
+        return list(six.moves.range(PROD_PORT_LOW, PROD_PORT_HIGH + 1))
+    return list(six.moves.range(NONPROD_PORT_LOW, NONPROD_PORT_HIGH + 1))
+
+
+def _allocate_sockets(environment, host_ip, sock_type, count, port_pool=None):
+    """Return a list of `count` socket bound to an ephemeral port.
+
+    If `port_pool` is given, draws from (and consumes) that pool so several
+    allocations can share one candidate list.
+    """
+    if count == 0:
+        return []
 
-    port_pool = random.sample(port_pool, PORT_SPAN)
+    if port_pool is None:
+        port_pool = _port_pool(environment)
 
     # socket objects are closed on GC so we need to return
     # them and expect the caller to keep them around while needed
     sockets = []
 
-    for real_port in port_pool:
-        if len(sockets) == count:
-            break
+    # Draw random ports one at a time (partial Fisher-Yates shuffle) -
+    # typically only a few are needed, no reason to shuffle the full span.
+    while port_pool and len(sockets) < count:
+        idx = _PORT_RNG.randrange(len(port_pool))
+        real_port = port_pool[idx]
+        port_pool[idx] = port_pool[-1]
+        port_pool.pop()
 
         socket_ = socket.socket(socket.AF_INET, sock_type)
         try:
@@ -160,26 +180,30 @@ def _allocate_sockets(environment, host_ip, sock_type, count):
             socket_.set_inheritable(True)
 
         sockets.append(socket_)
-    else:
+
+    if len(sockets) < count:
         raise exc.ContainerSetupError('{0} < {1}'.format(len(sockets), count),
                                       app_abort.AbortedReason.PORTS)
 
     return sockets
 
 
-def _allocate_network_ports_proto(host_ip, manifest, proto, so_type):
+def _allocate_network_ports_proto(host_ip, manifest, endpoints, proto,
+                                  so_type, port_pool=None):
     """Allocate ports for named and unnamed endpoints given protocol."""
     ephemeral_count = manifest['ephemeral_ports'].get(proto, 0)
-
-    endpoints = [ep for ep in manifest['endpoints']
-                 if ep.get('proto', 'tcp') == proto]
     endpoints_count = len(endpoints)
 
+    if endpoints_count + ephemeral_count == 0:
+        manifest['ephemeral_ports'][proto] = []
+        return []
+
     sockets = _allocate_sockets(
         manifest['environment'],
         host_ip,
         so_type,
-        endpoints_count + ephemeral_count
+        endpoints_count + ephemeral_count,
+        port_pool=port_pool
     )
 
     for idx, endpoint in enumerate(endpoints):
@@ -210,14 +234,31 @@ def allocate_network_ports(host_ip, manifest):
     :returns:
         ``list`` of bound sockets
     """
+    # Partition endpoints by protocol in one pass over the manifest.
+    tcp_endpoints = []
+    udp_endpoints = []
+    for endpoint in manifest['endpoints']:
+        proto = endpoint.get('proto') or 'tcp'
+        if proto == 'tcp':
+            tcp_endpoints.append(endpoint)
+        elif proto == 'udp':
+            udp_endpoints.append(endpoint)
+
+    # Both protocols draw from a single shared pool, so the candidate list
+    # is built once per container and ports are never offered twice.
+    port_pool = _port_pool(manifest['environment'])
     tcp_sockets = _allocate_network_ports_proto(host_ip,
                                                 manifest,
+                                                tcp_endpoints,
                                                 'tcp',
-                                                socket.SOCK_STREAM)
+                                                socket.SOCK_STREAM,
+                                                port_pool=port_pool)
     udp_sockets = _allocate_network_ports_proto(host_ip,
                                                 manifest,
+                                                udp_endpoints,
                                                 'udp',
-                                                socket.SOCK_DGRAM)
+                                                socket.SOCK_DGRAM,
+                                                port_pool=port_pool)
     return tcp_sockets + udp_sockets
 
 
@@ -152,7 +152,7 @@ class FsBackend(backend.Backend):
             stat = os.stat(fpath)
             meta = namedtuple('Metadata', 'ctime')(stat.st_ctime)
             with io.open(fpath) as datafile:
-                return yaml.load(datafile.read()), meta
+                return yaml.load(stream=datafile), meta
         except OSError:
             raise backend.ObjectNotFoundError()
 
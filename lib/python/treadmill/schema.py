@@ -41,19 +41,66 @@ class _RefResolver(jsonschema.RefResolver):
             return super(_RefResolver, self).resolve_remote(uri)
 
 
+# Validators are cached by canonicalized schema, so decorating several
+# functions with the same schema refs compiles each validator only once
+# per process.
+_RESOLVER = _RefResolver()
+_VALIDATORS = {}
+
+
+def _validator(schema_dict):
+    """Return cached validator for the given schema."""
+    key = json.dumps(schema_dict, sort_keys=True)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = jsonschema.Draft4Validator(
+            schema_dict, resolver=_RESOLVER
+        )
+        _VALIDATORS[key] = validator
+    return validator
+
+
+_MERGED_REFS = {}
+
+
+def merged_ref(*refs):
+    """Return a single schema merging the referenced subschemas.
+
+    Equivalent to ``{'allOf': [{'$ref': r} for r in refs]}`` for refs
+    with disjoint keywords (e.g. resource + verb schemas), but resolved
+    and flattened once at decoration time so validation is a single
+    pass with no per-call ref resolution.
+    """
+    merged = _MERGED_REFS.get(refs)
+    if merged is None:
+        merged = {}
+        for ref in refs:
+            url, resolved = _RESOLVER.resolve(ref)
+            # Anchor the merged schema in the referenced document so
+            # nested (relative) refs keep resolving against it.
+            merged.setdefault('id', url.split('#', 1)[0])
+            for key, value in resolved.items():
+                if key in merged and merged[key] != value:
+                    raise ValueError(
+                        'Conflicting keyword %r merging %r' % (key, refs)
+                    )
+                merged[key] = value
+        _MERGED_REFS[refs] = merged
+    return merged
+
+
 def schema(*schemas, **kwschemas):
     """Schema decorator."""
-    resolver = _RefResolver()
     validators = [
-        jsonschema.Draft4Validator(s, resolver=resolver)
+        _validator(s)
         for s in schemas
     ]
 
-    kwvalidator = jsonschema.Draft4Validator({
+    kwvalidator = _validator({
         'type': 'object',
         'additionalProperties': False,
         'properties': kwschemas,
-    }, resolver=resolver)
+    })
 
     def validate(args, kwargs):
         """Validate function arguments."""
@@ -15,7 +15,8 @@ from __future__ import unicode_literals
 import functools
 import logging
 import os
-import time
+import signal
+import threading
 
 import kazoo
 import click
@@ -64,9 +65,7 @@ def init():
             session_timeout=context.GLOBAL.zk.session_timeout
         )
 
-        while not zkclient.exists(z.SERVER_PRESENCE):
-            _LOGGER.warning('namespace not ready.')
-            time.sleep(30)
+        _wait_for_node(zkclient, z.SERVER_PRESENCE, 'namespace not ready.')
 
         hostname = sysinfo.hostname()
 
@@ -74,9 +73,11 @@ def init():
         zk_server_path = z.path.server(hostname)
         zk_presence_path = z.path.server_presence(hostname)
 
-        while not zkclient.exists(zk_server_path):
-            _LOGGER.warning('server %s not defined in the cell.', hostname)
-            time.sleep(30)
+        _wait_for_node(
+            zkclient,
+            zk_server_path,
+            'server %s not defined in the cell.' % hostname
+        )
 
         _LOGGER.info('Checking blackout list.')
         blacklisted = bool(zkclient.exists(zk_blackout_path))
@@ -138,9 +139,13 @@ def init():
         if exit_on_fail:
             utils.sys_exit(-1)
         else:
-            # Sit forever in a broken state
-            while True:
-                time.sleep(1000000)
+            # Sit forever in a broken state, parked in a single blocking
+            # call instead of a periodic-wakeup sleep loop.
+            if os.name == 'posix':
+                while True:
+                    signal.pause()
+            else:
+                threading.Event().wait()
 
     return top
 
@@ -275,6 +280,28 @@ def _stop_on_lost(tm_env, state):
         utils.sys_exit(-1)
 
 
+def _wait_for_node(zkclient, zk_path, warning):
+    """Wait for a zookeeper node to exist.
+
+    Event driven: wakes up as soon as the node is created instead of
+    polling, logging `warning` periodically while still waiting.
+    """
+    node_created_event = zkclient.handler.event_object()
+
+    @zkclient.DataWatch(zk_path)
+    @utils.exit_on_unhandled
+    def _exit_on_create(data, _stat, _event):
+        """Stop watching once the node exists."""
+        if data is not None:
+            node_created_event.set()
+            return False
+        # Reestablish the watch.
+        return True
+
+    while not node_created_event.wait(30):
+        _LOGGER.warning(warning)
+
+
 def _main_loop(tm_env, zkclient, zk_presence_path):
     """Main loop.
 
@@ -7,6 +7,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import abc
+import concurrent.futures
 import errno
 import logging
 import os
@@ -22,6 +23,9 @@ from . import _utils
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Number of threads used to read services of a scan directory in parallel.
+_MAX_SCAN_WORKERS = 8
+
 
 @six.add_metaclass(abc.ABCMeta)
 class ScanDir:
@@ -74,16 +78,31 @@ class ScanDir:
         if self._services is None:
             self._services = {}
 
-            try:
-                for name in os.listdir(self._dir):
-                    if name[0] == '.':
-                        continue
+            def _read_service(name):
+                """Read service data from one scan directory entry.
+                """
+                dir_path = os.path.join(self._dir, name)
+                if not os.path.isdir(dir_path):
+                    return None
+                return _service_base.Service.read_dir(dir_path)
 
-                    dir_path = os.path.join(self._dir, name)
-                    if not os.path.isdir(dir_path):
-                        continue
+            try:
+                names = [
+                    name
+                    for name in os.listdir(self._dir)
+                    if name[0] != '.'
+                ]
+
+                # Service reads are independent and I/O bound, overlap them
+                # when scanning a populated directory.
+                if len(names) > 1:
+                    with concurrent.futures.ThreadPoolExecutor(
+                            max_workers=_MAX_SCAN_WORKERS) as executor:
+                        svc_datas = list(executor.map(_read_service, names))
+                else:
+                    svc_datas = [_read_service(name) for name in names]
 
-                    svc_data = _service_base.Service.read_dir(dir_path)
+                for svc_data in svc_datas:
                     if svc_data is None:
                         continue
 
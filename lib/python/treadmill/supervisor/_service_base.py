@@ -28,17 +28,27 @@ class ServiceType(enum.Enum):
     Bundle = 'bundle'
 
 
+#: Service type by on-disk value, avoids enum construction when reading
+#: service directories in bulk.
+_TYPE_BY_VALUE = {
+    svc_type.value: svc_type
+    for svc_type in ServiceType
+}
+
+
 class Service:
     """Abstract base class of all services.
     """
     __slots__ = (
         '_dir',
         '_name',
+        '_present_files',
     )
 
     def __init__(self, directory, name):
         self._name = name
         self._dir = os.path.join(directory, name)
+        self._present_files = None
 
     def __repr__(self):
         return '{type}({name})'.format(
@@ -72,6 +82,26 @@ class Service:
         """
         return self._dir
 
+    @property
+    def _dir_files(self):
+        """Names of the files present in the service directory.
+
+        The directory is scanned once and the result cached, replacing
+        repeated per-file existence checks. Subclasses reset the cache after
+        :meth:`write`.
+
+        :returns ``frozenset``:
+            Filenames present in the service directory.
+        """
+        if self._present_files is None:
+            try:
+                self._present_files = frozenset(os.listdir(self._dir))
+            except OSError as err:
+                if err.errno is not errno.ENOENT:
+                    raise
+                self._present_files = frozenset()
+        return self._present_files
+
     @abc.abstractmethod
     def write(self):
         """Write down the service definition.
@@ -97,9 +127,8 @@ class Service:
                 raise
             return None
 
-        try:
-            svc_type = ServiceType(svc_type)
-        except ValueError:
+        svc_type = _TYPE_BY_VALUE.get(svc_type)
+        if svc_type is None:
             return None
 
         return svc_type, svc_basedir, svc_name
@@ -18,8 +18,13 @@ _ENV_KEY_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_.]*$')
 _LOGGER = logging.getLogger(__name__)
 
 
-def _write(filename, func, mode='wb', permission=None):
-    with io.open(filename, mode) as f:
+def _write(filename, func, mode='wb', permission=None, dir_fd=None):
+    opener = None
+    if dir_fd is not None:
+        def opener(path, flags):
+            """Open `path` relative to an already open directory."""
+            return os.open(path, flags, dir_fd=dir_fd)
+    with io.open(filename, mode, opener=opener) as f:
         if func is not None:
             func(f)
             f.flush()
@@ -28,8 +33,26 @@ def _write(filename, func, mode='wb', permission=None):
             os.fchmod(f.fileno(), permission)
 
 
-def _write_data(filename, data, mode='wb', permission=None):
-    _write(filename, lambda f: f.write(data), mode=mode, permission=permission)
+def _write_data(filename, data, mode='wb', permission=None, dir_fd=None):
+    _write(filename, lambda f: f.write(data), mode=mode, permission=permission,
+           dir_fd=dir_fd)
+
+
+def write_dir_open(directory):
+    """Open a directory for use as `dir_fd` in the write utilities.
+
+    Writing service files relative to an open directory saves the kernel a
+    full path resolution per file.
+
+    :param ``str`` directory:
+        Directory the subsequent writes happen in.
+    :returns ``int``:
+        Directory file descriptor, or ``None`` on platforms without `dir_fd`
+        support. The caller owns the descriptor and must `os.close` it.
+    """
+    if os.open not in os.supports_dir_fd:
+        return None
+    return os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
 
 
 def data_read(filename):
@@ -45,18 +68,21 @@ def data_read(filename):
     return data.strip()
 
 
-def data_write(filename, data):
+def data_write(filename, data, dir_fd=None):
     """Write string to a file with newline added.
 
     :param ``str`` filename:
         File to write to.
     :param ``str`` data:
         File content. If None, create an empty file.
+    :param ``int`` dir_fd:
+        Optional directory descriptor `filename` is relative to.
     """
     if data is not None:
-        _write_data(filename, data + '\n', mode='w', permission=0o644)
+        _write_data(filename, data + '\n', mode='w', permission=0o644,
+                    dir_fd=dir_fd)
     else:
-        _write(filename, None, mode='w', permission=0o644)
+        _write(filename, None, mode='w', permission=0o644, dir_fd=dir_fd)
 
 
 def environ_dir_write(env_dir, env, update=False):
@@ -72,34 +98,50 @@ def environ_dir_write(env_dir, env, update=False):
         to ``True``, then add/set the new Key/Value pairs from the dictionary
         but leave other values in the directory.
     """
-    if not update:
-        for key in os.listdir(env_dir):
-            if key not in env:
-                os.unlink(os.path.join(env_dir, key))
-
-    for key, value in six.iteritems(env):
-        if not _ENV_KEY_RE.match(key):
-            _LOGGER.warning('Ignoring invalid environ variable %r', key)
-            continue
-
-        filename = os.path.join(env_dir, key)
-        if value is not None:
-            # Make sure we have utf8 strings
-            if hasattr(value, 'decode'):
-                value = value.decode()
-            value = '{}'.format(value)
-            # The value must be properly escaped, all tailing newline
-            # should be removed and the newlines replaced with \0
-            data = (
-                value
-                .encode(encoding='utf8', errors='replace')
-                .rstrip(b'\n')
-                .replace(b'\n', b'\x00')
-            )
-            _write_data(filename, data, mode='wb', permission=0o644)
-        else:
-            # Write empty file, it will remove a variable from the environment.
-            _write(filename, None, mode='wb', permission=0o644)
+    # Resolve the environ directory once, all files are created through the
+    # same directory descriptor.
+    dir_fd = write_dir_open(env_dir)
+    try:
+        if not update:
+            for key in os.listdir(env_dir):
+                if key not in env:
+                    if dir_fd is not None:
+                        os.unlink(key, dir_fd=dir_fd)
+                    else:
+                        os.unlink(os.path.join(env_dir, key))
+
+        for key, value in six.iteritems(env):
+            if not _ENV_KEY_RE.match(key):
+                _LOGGER.warning('Ignoring invalid environ variable %r', key)
+                continue
+
+            if dir_fd is not None:
+                filename = key
+            else:
+                filename = os.path.join(env_dir, key)
+            if value is not None:
+                # Make sure we have utf8 strings
+                if hasattr(value, 'decode'):
+                    value = value.decode()
+                value = '{}'.format(value)
+                # The value must be properly escaped, all tailing newline
+                # should be removed and the newlines replaced with \0
+                data = (
+                    value
+                    .encode(encoding='utf8', errors='replace')
+                    .rstrip(b'\n')
+                    .replace(b'\n', b'\x00')
+                )
+                _write_data(filename, data, mode='wb', permission=0o644,
+                            dir_fd=dir_fd)
+            else:
+                # Write empty file, it will remove a variable from the
+                # environment.
+                _write(filename, None, mode='wb', permission=0o644,
+                       dir_fd=dir_fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def environ_dir_read(env_dir):
@@ -152,19 +194,22 @@ def set_list_read(filename):
     }
 
 
-def set_list_write(filename, entries):
+def set_list_write(filename, entries, dir_fd=None):
     """Write a list of values to a file. One per line.
 
     :param ``str`` filename:
         File to write to.
     :param ``set`` entries:
         Set of unicode values to write into ``filename``.
+    :param ``int`` dir_fd:
+        Optional directory descriptor `filename` is relative to.
     """
     _write(
         filename,
         lambda f: f.writelines(entries),
         mode='wb',
-        permission=0o644
+        permission=0o644,
+        dir_fd=dir_fd
     )
 
 
@@ -190,15 +235,17 @@ def value_read(filename, default=0):
     return int(value)
 
 
-def value_write(filename, value):
+def value_write(filename, value, dir_fd=None):
     """Write an integer value to a file.
 
     :param ``str`` filename:
         File to write to.
     :param ``int`` value:
         Value to write in the file.
+    :param ``int`` dir_fd:
+        Optional directory descriptor `filename` is relative to.
     """
-    data_write(filename, '%d' % value)
+    data_write(filename, '%d' % value, dir_fd=dir_fd)
 
 
 def script_read(filename):
@@ -214,7 +261,7 @@ def script_read(filename):
     return script
 
 
-def script_write(filename, script):
+def script_write(filename, script, dir_fd=None):
     """Write a script to a file.
 
     Proper execute permissions will be set.
@@ -223,6 +270,8 @@ def script_write(filename, script):
         File to write to.
     :param ``iterable|unicode`` script:
         Unicode string or iterable.
+    :param ``int`` dir_fd:
+        Optional directory descriptor `filename` is relative to.
     """
     if isinstance(script, six.string_types):
         # If the script is fully provided in a string, wrap it in a StringIO
@@ -238,7 +287,8 @@ def script_write(filename, script):
             f.write('\n\n')
             os.fchmod(f.fileno(), 0o755)
 
-    _write(filename, _chunks_write, mode='w', permission=0o755)
+    _write(filename, _chunks_write, mode='w', permission=0o755,
+           dir_fd=dir_fd)
 
 
 __all__ = (
@@ -252,4 +302,5 @@ __all__ = (
     'set_list_write',
     'value_read',
     'value_write',
+    'write_dir_open',
 )
@@ -21,6 +21,19 @@ from .. import _service_base
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Sentinel cached in place of optional scripts that are absent on disk, so
+#: that repeated attribute access does not re-read the service directory
+#: (``None`` means "not read yet", not "known missing").
+_MISSING = object()
+
+
+def _svc_file(directory, name, dir_fd):
+    """Path of a service file for writing, relative when `dir_fd` is open.
+    """
+    if dir_fd is not None:
+        return name
+    return os.path.join(directory, name)
+
 
 class BundleService(_service_base.Service):
     """s6 rc bundle service.
@@ -56,12 +69,13 @@ class BundleService(_service_base.Service):
         """
         super(BundleService, self).write()
         # Mandatory settings
-        if not self._contents and not os.path.exists(self._contents_file):
+        if not self._contents and 'contents' not in self._dir_files:
             raise ValueError('Invalid Bundle: No content')
         if self._contents is not None:
             if not self._contents:
                 raise ValueError('Invalid Bundle: empty')
             _utils.set_list_write(self._contents_file, self._contents)
+        self._present_files = None
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -70,16 +84,27 @@ class _AtomicService(_service_base.Service):
     """
     __slots__ = (
         '_dependencies',
+        '_dirs_created',
         '_timeout_up',
         '_timeout_down',
         '_env',
     )
 
+    #: Simple service settings written by :meth:`write`, as
+    #: ``(filename, attribute, writer)``. Settings that need extra handling
+    #: stay explicit in the method.
+    _WRITE_FIELDS = (
+        ('dependencies', '_dependencies', _utils.set_list_write),
+        ('timeout-up', '_timeout_up', _utils.value_write),
+        ('timeout-down', '_timeout_down', _utils.value_write),
+    )
+
     def __init__(self, directory, name,
                  timeout_up=None, timeout_down=None,
                  dependencies=None, environ=None):
         super(_AtomicService, self).__init__(directory, name)
         self._dependencies = dependencies
+        self._dirs_created = False
         self._timeout_up = timeout_up
         self._timeout_down = timeout_down
         self._env = environ
@@ -170,22 +195,28 @@ class _AtomicService(_service_base.Service):
         """
         super(_AtomicService, self).write()
         # We only write dependencies/environ if we have new ones.
-        fs.mkdir_safe(self.env_dir)
-        fs.mkdir_safe(self.data_dir)
-        if self._dependencies is not None:
-            _utils.set_list_write(self._dependencies_file, self._dependencies)
-        if self._env is not None:
-            _utils.environ_dir_write(self.env_dir, self._env)
-        if self._timeout_up is not None:
-            _utils.value_write(
-                os.path.join(self._dir, 'timeout-up'),
-                self._timeout_up
-            )
-        if self._timeout_down is not None:
-            _utils.value_write(
-                os.path.join(self._dir, 'timeout-down'),
-                self._timeout_down
-            )
+        if not self._dirs_created:
+            fs.mkdir_safe(self.env_dir)
+            fs.mkdir_safe(self.data_dir)
+            self._dirs_created = True
+        # Resolve the service directory once, all settings are small files
+        # written through the same directory descriptor.
+        dir_fd = _utils.write_dir_open(self._dir)
+        try:
+            for relname, attrib, writer in _AtomicService._WRITE_FIELDS:
+                value = getattr(self, attrib)
+                if value is not None:
+                    writer(
+                        _svc_file(self._dir, relname, dir_fd),
+                        value,
+                        dir_fd=dir_fd
+                    )
+            if self._env is not None:
+                _utils.environ_dir_write(self.env_dir, self._env)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        self._present_files = None
 
 
 class LongrunService(_AtomicService):
@@ -206,6 +237,16 @@ class LongrunService(_AtomicService):
 
     _TYPE = _service_base.ServiceType.LongRun
 
+    #: Simple service settings written by :meth:`write`, see
+    #: :attr:`_AtomicService._WRITE_FIELDS`.
+    _WRITE_FIELDS = (
+        ('timeout-finish', '_timeout_finish', _utils.value_write),
+        ('notification-fd', '_notification_fd', _utils.value_write),
+        ('pipeline-name', '_pipeline_name', _utils.data_write),
+        ('producer-for', '_producer_for', _utils.data_write),
+        ('consumer-for', '_consumer_for', _utils.data_write),
+    )
+
     def __init__(self, directory, name,
                  run_script=None, finish_script=None, notification_fd=None,
                  log_run_script=None, timeout_finish=None, default_down=None,
@@ -262,9 +303,7 @@ class LongrunService(_AtomicService):
         """Is the default service state set to down?
         """
         if self._default_down is None:
-            self._default_down = os.path.exists(
-                os.path.join(self._dir, 'down')
-            )
+            self._default_down = 'down' in self._dir_files
         return self._default_down
 
     @default_down.setter
@@ -305,6 +344,10 @@ class LongrunService(_AtomicService):
             except IOError as err:
                 if err.errno is not errno.ENOENT:
                     raise
+                # Cache the miss, the script is optional.
+                self._finish_script = _MISSING
+        if self._finish_script is _MISSING:
+            return None
         return self._finish_script
 
     @finish_script.setter
@@ -321,6 +364,10 @@ class LongrunService(_AtomicService):
             except IOError as err:
                 if err.errno is not errno.ENOENT:
                     raise
+                # Cache the miss, the script is optional.
+                self._log_run_script = _MISSING
+        if self._log_run_script is _MISSING:
+            return None
         return self._log_run_script
 
     @log_run_script.setter
@@ -411,49 +458,59 @@ class LongrunService(_AtomicService):
         # pylint: disable=R0912
         super(LongrunService, self).write()
         # Mandatory settings
-        if self._run_script is None and not os.path.exists(self._run_file):
+        if self._run_script is None and 'run' not in self._dir_files:
             raise ValueError('Invalid LongRun service: not run script')
-        if self._run_script is not None:
-            _utils.script_write(self._run_file, self._run_script)
-            # Handle the case where the run script is a generator
-            if not isinstance(self._run_script, six.string_types):
-                self._run_script = None
-        # Optional settings
-        if self._finish_script is not None:
-            _utils.script_write(self._finish_file, self._finish_script)
-            # Handle the case where the finish script is a generator
-            if not isinstance(self._finish_script, six.string_types):
-                self._finish_script = None
-        if self._log_run_script is not None:
-            # Create the log dir on the spot
-            fs.mkdir_safe(os.path.dirname(self._log_run_file))
-            _utils.script_write(self._log_run_file, self._log_run_script)
-            # Handle the case where the run script is a generator
-            if not isinstance(self._log_run_script, six.string_types):
-                self._log_run_script = None
-        if self._default_down:
-            _utils.data_write(
-                os.path.join(self._dir, 'down'),
-                None
-            )
-        else:
-            fs.rm_safe(os.path.join(self._dir, 'down'))
-        if self._timeout_finish is not None:
-            _utils.value_write(
-                os.path.join(self._dir, 'timeout-finish'),
-                self._timeout_finish
-            )
-        if self._notification_fd is not None:
-            _utils.value_write(
-                os.path.join(self._dir, 'notification-fd'),
-                self._notification_fd
-            )
-        if self._pipeline_name is not None:
-            _utils.data_write(self._pipeline_name_file, self._pipeline_name)
-        if self._producer_for is not None:
-            _utils.data_write(self._producer_for_file, self._producer_for)
-        if self._consumer_for is not None:
-            _utils.data_write(self._consumer_for_file, self._consumer_for)
+        # Resolve the service directory once for all the settings below.
+        dir_fd = _utils.write_dir_open(self._dir)
+        try:
+            if self._run_script is not None:
+                _utils.script_write(
+                    _svc_file(self._dir, 'run', dir_fd),
+                    self._run_script,
+                    dir_fd=dir_fd
+                )
+                # Handle the case where the run script is a generator
+                if not isinstance(self._run_script, six.string_types):
+                    self._run_script = None
+            # Optional settings
+            if self._finish_script is not None and \
+                    self._finish_script is not _MISSING:
+                _utils.script_write(
+                    _svc_file(self._dir, 'finish', dir_fd),
+                    self._finish_script,
+                    dir_fd=dir_fd
+                )
+                # Handle the case where the finish script is a generator
+                if not isinstance(self._finish_script, six.string_types):
+                    self._finish_script = None
+            if self._log_run_script is not None and \
+                    self._log_run_script is not _MISSING:
+                # Create the log dir on the spot
+                fs.mkdir_safe(os.path.dirname(self._log_run_file))
+                _utils.script_write(self._log_run_file, self._log_run_script)
+                # Handle the case where the run script is a generator
+                if not isinstance(self._log_run_script, six.string_types):
+                    self._log_run_script = None
+            if self._default_down:
+                _utils.data_write(
+                    _svc_file(self._dir, 'down', dir_fd),
+                    None,
+                    dir_fd=dir_fd
+                )
+            else:
+                fs.rm_safe(os.path.join(self._dir, 'down'))
+            for relname, attrib, writer in LongrunService._WRITE_FIELDS:
+                value = getattr(self, attrib)
+                if value is not None:
+                    writer(
+                        _svc_file(self._dir, relname, dir_fd),
+                        value,
+                        dir_fd=dir_fd
+                    )
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        self._present_files = None
 
 
 class OneshotService(_AtomicService):
@@ -524,7 +581,7 @@ class OneshotService(_AtomicService):
         """
         super(OneshotService, self).write()
         # Mandatory settings
-        if not self._up and not os.path.exists(self._up_file):
+        if not self._up and 'up' not in self._dir_files:
             raise ValueError('Invalid Oneshot service: not up script')
         if self._up is not None:
             _utils.script_write(self._up_file, self._up)
@@ -535,6 +592,16 @@ class OneshotService(_AtomicService):
             _utils.script_write(self._down_file, self._down)
             if not isinstance(self._down_file, six.string_types):
                 self._down_file = None
+        self._present_files = None
+
+
+#: Service type to implementation class dispatch table, built once instead
+#: of on every :func:`create_service` call.
+_SERVICE_CLS = {
+    _service_base.ServiceType.Bundle: BundleService,
+    _service_base.ServiceType.LongRun: LongrunService,
+    _service_base.ServiceType.Oneshot: OneshotService,
+}
 
 
 def create_service(svc_basedir, svc_name, svc_type, **kwargs):
@@ -551,11 +618,7 @@ def create_service(svc_basedir, svc_name, svc_type, **kwargs):
     :returns ``Service``:
         New instance of the service
     """
-    cls = {
-        _service_base.ServiceType.Bundle: BundleService,
-        _service_base.ServiceType.LongRun: LongrunService,
-        _service_base.ServiceType.Oneshot: OneshotService,
-    }.get(svc_type, None)
+    cls = _SERVICE_CLS.get(svc_type, None)
 
     if cls is None:
         _LOGGER.critical('No implementation for service type %r', svc_type)
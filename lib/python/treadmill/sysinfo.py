@@ -8,6 +8,7 @@ from __future__ import unicode_literals
 
 from collections import namedtuple
 
+import functools
 import io
 import multiprocessing
 import os
@@ -162,8 +163,14 @@ def _cpuflags_windows():
     return []
 
 
+@functools.lru_cache(maxsize=1)
 def hostname():
-    """Hostname of the server."""
+    """Hostname of the server.
+
+    The result is cached for the life of the process - the canonical name
+    lookup can hit the resolver, and callers all over the tree treat the
+    hostname as a constant anyway.
+    """
     treadmill_hostname = os.environ.get('TREADMILL_HOSTNAME')
     if treadmill_hostname:
         return treadmill_hostname.lower()
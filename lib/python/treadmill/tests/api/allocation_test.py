@@ -1,11 +1,6 @@
 """Allocation API tests.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import unittest
 
 import mock
@@ -21,6 +16,7 @@ class ApiAllocationTest(unittest.TestCase):
     @mock.patch('treadmill.context.AdminContext.conn',
                 mock.Mock(return_value=None))
     def setUp(self):
+        allocation._ALLOCS_CACHE.clear()
         self.alloc_api = allocation.API()
 
     def tearDown(self):
@@ -66,6 +62,39 @@ class ApiAllocationTest(unittest.TestCase):
              'memory': '1G'},
         )
 
+    @mock.patch('treadmill.context.AdminContext.cell_allocation',
+                mock.Mock(return_value=mock.Mock(**{
+                    'create.return_value': {},
+                    'get.return_value': {},
+                })))
+    @mock.patch('treadmill.api.allocation._check_capacity',
+                mock.Mock(return_value=None))
+    def test_reservation_create_many(self):
+        """Dummy test for treadmill.api.allocation.create_many()"""
+        alloc_adm = treadmill.context.AdminContext.cell_allocation.return_value
+        self.alloc_api.reservation.create_many([
+            ('tenant/alloc/cell1',
+             {'memory': '1G', 'cpu': '100%', 'disk': '2G'}),
+            ('tenant/alloc/cell2',
+             {'memory': '1G', 'cpu': '100%', 'disk': '2G'}),
+        ])
+        alloc_adm.create.assert_any_call(
+            ['cell1', 'tenant/alloc'],
+            {'disk': '2G',
+             'partition': '_default',
+             'cpu': '100%',
+             'rank': 100,
+             'memory': '1G'},
+        )
+        alloc_adm.create.assert_any_call(
+            ['cell2', 'tenant/alloc'],
+            {'disk': '2G',
+             'partition': '_default',
+             'cpu': '100%',
+             'rank': 100,
+             'memory': '1G'},
+        )
+
     # Disable W0212(protected-access)
     # pylint: disable=W0212
     @mock.patch('treadmill.api.allocation._api_plugins',
@@ -102,6 +131,7 @@ class ApiAllocationTest(unittest.TestCase):
         alloc_admin.list.return_value = [
             {
                 '_id': 'tenant/alloc/cellname',
+                'partition': 'ppp',
                 'traits': ['a'],
                 'cpu': '100%',
                 'disk': '100G',
@@ -154,6 +184,7 @@ class ApiAllocationTest(unittest.TestCase):
         alloc_admin.list.return_value = [
             {
                 '_id': 'tenant/otheralloc/cellname',
+                'partition': 'ppp',
                 'traits': ['a'],
                 'cpu': '100%',
                 'disk': '95G',
@@ -173,13 +204,14 @@ class ApiAllocationTest(unittest.TestCase):
             )
 
     @mock.patch('treadmill.api.allocation._check_capacity',
-                mock.Mock(return_value=True))
+                mock.Mock(return_value=None))
     @mock.patch('treadmill.context.AdminContext.cell_allocation')
     def test_reservation_update(self, ca_factory):
         """Test updating reservation.
         """
         alloc_admin = ca_factory.return_value
         alloc_admin.update.return_value = None
+        alloc_admin.list.return_value = []
         alloc_admin.get.return_value = {
             '_id': 'test/dev/cell',
             'cpu': '100%',
@@ -1,11 +1,6 @@
 """Cell API tests.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import unittest
 
 import mock
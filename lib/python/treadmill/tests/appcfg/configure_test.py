@@ -40,7 +40,8 @@ class AppCfgConfigureTest(unittest.TestCase):
 
     @unittest.skipUnless(sys.platform.startswith('linux'), 'Requires Linux')
     @mock.patch('pwd.getpwnam', mock.Mock(auto_spec=True))
-    @mock.patch('shutil.copyfile', mock.Mock(auto_spec=True))
+    @mock.patch('treadmill.appcfg.configure._copy_manifest',
+                mock.Mock(auto_spec=True))
     @mock.patch('treadmill.appcfg.manifest.load', auto_spec=True)
     @mock.patch('treadmill.trace.post', mock.Mock(auto_spec=True))
     @mock.patch('treadmill.fs.write_safe', mock.mock_open())
@@ -115,11 +116,10 @@ class AppCfgConfigureTest(unittest.TestCase):
         treadmill.fs.write_safe.assert_called_with(
             os.path.join(app_dir, 'data', 'app.json'),
             mock.ANY,
-            mode='w',
             permission=0o644
         )
 
-        shutil.copyfile.assert_called_with(
+        app_cfg._copy_manifest.assert_called_with(
             '/some/event',
             os.path.join(app_dir, 'data', 'manifest.yml')
         )
@@ -135,7 +135,8 @@ class AppCfgConfigureTest(unittest.TestCase):
 
     @unittest.skipUnless(sys.platform.startswith('linux'), 'Requires Linux')
     @mock.patch('pwd.getpwnam', mock.Mock(auto_spec=True))
-    @mock.patch('shutil.copyfile', mock.Mock(auto_spec=True))
+    @mock.patch('treadmill.appcfg.configure._copy_manifest',
+                mock.Mock(auto_spec=True))
     @mock.patch('shutil.rmtree', mock.Mock())
     @mock.patch('treadmill.appcfg.manifest.load', auto_spec=True)
     @mock.patch('treadmill.trace.post', mock.Mock(auto_spec=True))
@@ -188,7 +189,8 @@ class AppCfgConfigureTest(unittest.TestCase):
         mock_create_svc.return_value.directory = app_dir
         mock_create_svc.return_value.data_dir = os.path.join(app_dir, 'data')
 
-        shutil.copyfile.side_effect = IOError(2, 'No such file or directory')
+        app_cfg._copy_manifest.side_effect = IOError(
+            2, 'No such file or directory')
 
         app_cfg.configure(self.tm_env, '/some/event', 'linux')
 
@@ -212,7 +214,7 @@ class AppCfgConfigureTest(unittest.TestCase):
             environment='dev'
         )
 
-        shutil.copyfile.assert_called_with(
+        app_cfg._copy_manifest.assert_called_with(
             '/some/event',
             os.path.join(app_dir, 'data', 'manifest.yml')
         )
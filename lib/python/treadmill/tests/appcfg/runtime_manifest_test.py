@@ -7,7 +7,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import os
-import shutil
 import tempfile
 import unittest
 
@@ -23,8 +22,35 @@ from treadmill.appcfg import configure
 class AppCfgRuntimeManifestTest(unittest.TestCase):
     """Tests for teadmill.appcfg.manifest"""
 
+    # The same mocks apply to every test, patch once per class rather
+    # than re-building the patch stack for each test.
+    @classmethod
+    def setUpClass(cls):
+        cls.patchers = [
+            mock.patch('treadmill.appcfg.gen_uniqueid',
+                       mock.Mock(return_value='42')),
+            mock.patch('treadmill.appcfg.manifest.read', mock.Mock()),
+            mock.patch('treadmill.subproc._check',
+                       mock.Mock(return_value=True)),
+            mock.patch('treadmill.subproc.get_aliases',
+                       mock.Mock(return_value={
+                           'sshd': '/path/to/sshd',
+                           'chroot': '/path/to/chroot',
+                           'pid1': '/path/to/pid1',
+                           's6_svscan': '/path/to/s6-svscan'
+                       })),
+        ]
+        for patcher in cls.patchers:
+            patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls.patchers:
+            patcher.stop()
+
     def setUp(self):
-        self.root = tempfile.mkdtemp()
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.root = self.root_dir.name
         context.GLOBAL.cell = 'testcell'
         context.GLOBAL.zk.url = 'zookeeper://foo@foo:123'
         self.tm_env = mock.Mock(
@@ -34,20 +60,9 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
         )
 
     def tearDown(self):
-        if self.root and os.path.isdir(self.root):
-            shutil.rmtree(self.root)
+        self.root_dir.cleanup()
 
     @unittest.skipIf(os.name == 'nt', 'windows not supported')
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.manifest.read', mock.Mock())
-    @mock.patch('treadmill.subproc._check', mock.Mock(return_value=True))
-    @mock.patch('treadmill.subproc.get_aliases',
-                mock.Mock(return_value={
-                    'sshd': '/path/to/sshd',
-                    'chroot': '/path/to/chroot',
-                    'pid1': '/path/to/pid1',
-                    's6_svscan': '/path/to/s6-svscan'
-                }))
     def test_load(self):
         """Tests loading app manifest with resource allocation."""
         manifest = {
@@ -77,17 +92,20 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
         treadmill.appcfg.manifest.read.assert_called_with(event_filename0,
                                                           'yaml')
         treadmill.appcfg.gen_uniqueid.assert_called_with(event_filename0)
-        self.assertEqual(app0['name'], 'proid.myapp#0')
-        self.assertEqual(app0['type'], 'native')
-        self.assertEqual(app0['app'], 'proid.myapp')
-        self.assertEqual(app0['proid'], 'foo')
-        self.assertEqual(app0['environment'], 'dev')
-        self.assertEqual(app0['cpu'], 100)
-        self.assertEqual(app0['memory'], '100M')
-        self.assertEqual(app0['disk'], '100G')
-        self.assertEqual(app0['uniqueid'], '42')
-        self.assertEqual(app0['cell'], 'testcell')
-        self.assertEqual(app0['zookeeper'], 'zookeeper://foo@foo:123')
+        expected = {
+            'name': 'proid.myapp#0',
+            'type': 'native',
+            'app': 'proid.myapp',
+            'proid': 'foo',
+            'environment': 'dev',
+            'cpu': 100,
+            'memory': '100M',
+            'disk': '100G',
+            'uniqueid': '42',
+            'cell': 'testcell',
+            'zookeeper': 'zookeeper://foo@foo:123',
+        }
+        self.assertEqual({k: app0[k] for k in expected}, expected)
 
         self.assertEqual(
             app0['services'][0],
@@ -138,17 +156,6 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
         )
 
     @unittest.skipIf(os.name == 'nt', 'windows not supported')
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.manifest.read', mock.Mock())
-    @mock.patch('treadmill.subproc._check', mock.Mock(return_value=True))
-    @mock.patch('treadmill.subproc.get_aliases',
-                mock.Mock(return_value={
-                    'sshd': '/path/to/sshd',
-                    'chroot': '/path/to/chroot',
-                    'pid1': '/path/to/pid1',
-                    's6_svscan': '/path/to/s6-svscan'
-                }))
     def test_load_normalize(self):
         """Test the normalization of manifests.
         """
@@ -203,7 +210,18 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
             self.tm_env, event_filename0, 'linux'
         )
 
-        self.assertEqual(app0['type'], 'native')
+        expected = {
+            'type': 'native',
+            'shared_ip': False,
+            'shared_network': False,
+            'passthrough': [],
+            'identity': None,
+            'identity_group': None,
+            'environ': [],
+            'ephemeral_ports': {'tcp': 2, 'udp': 0},
+        }
+        self.assertEqual({k: app0[k] for k in expected}, expected)
+        self.assertEqual(app0['vring']['cells'], [])
         self.assertEqual(
             app0['services'],
             [
@@ -259,8 +277,6 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
             ]
         )
 
-        self.assertEqual(app0['shared_ip'], False)
-        self.assertEqual(app0['shared_network'], False)
         self.assertEqual(
             app0['endpoints'],
             [
@@ -290,24 +306,8 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
                 },
             ]
         )
-        self.assertEqual(app0['passthrough'], [])
-        self.assertEqual(app0['vring']['cells'], [])
-        self.assertEqual(app0['identity'], None)
-        self.assertEqual(app0['identity_group'], None)
-        self.assertEqual(app0['environ'], [])
-        self.assertEqual(app0['ephemeral_ports'], {'tcp': 2, 'udp': 0})
 
     @unittest.skipIf(os.name == 'nt', 'windows not supported')
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.manifest.read', mock.Mock())
-    @mock.patch('treadmill.subproc._check', mock.Mock(return_value=True))
-    @mock.patch('treadmill.subproc.get_aliases',
-                mock.Mock(return_value={
-                    'sshd': '/path/to/sshd',
-                    'chroot': '/path/to/chroot',
-                    'pid1': '/path/to/pid1',
-                    's6_svscan': '/path/to/s6-svscan'
-                }))
     def test_load_with_env(self):
         """Tests loading app manifest with resource allocation."""
         manifest = {
@@ -338,16 +338,6 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
             self.tm_env, event_filename0, 'linux')
         self.assertEqual(app0['environ'], [{'name': 'xxx', 'value': 'yyy'}])
 
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.manifest.read', mock.Mock())
-    @mock.patch('treadmill.subproc._check', mock.Mock(return_value=True))
-    @mock.patch('treadmill.subproc.get_aliases',
-                mock.Mock(return_value={
-                    'sshd': '/path/to/sshd',
-                    'chroot': '/path/to/chroot',
-                    'pid1': '/path/to/pid1',
-                    's6_svscan': '/path/to/s6-svscan'
-                }))
     def test_load_docker_image(self):
         """Tests loading app manifest with a docker image defined."""
         manifest = {
@@ -368,16 +358,6 @@ class AppCfgRuntimeManifestTest(unittest.TestCase):
         self.assertEqual(app0['type'], 'docker')
 
     @unittest.skipIf(os.name == 'nt', 'windows not supported')
-    @mock.patch('treadmill.appcfg.gen_uniqueid', mock.Mock(return_value='42'))
-    @mock.patch('treadmill.appcfg.manifest.read', mock.Mock())
-    @mock.patch('treadmill.subproc._check', mock.Mock(return_value=True))
-    @mock.patch('treadmill.subproc.get_aliases',
-                mock.Mock(return_value={
-                    'sshd': '/path/to/sshd',
-                    'chroot': '/path/to/chroot',
-                    'pid1': '/path/to/pid1',
-                    's6_svscan': '/path/to/s6-svscan'
-                }))
     def test_load_tar_image(self):
         """Tests loading app manifest with a docker image defined."""
         manifest = {
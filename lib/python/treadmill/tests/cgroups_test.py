@@ -282,6 +282,22 @@ class CGroupsTest(unittest.TestCase):
         value = cgroups.get_value('memory', 'foo', 'memory.usage_in_bytes')
         self.assertEqual(value, 0)
 
+    @mock.patch('os.open', mock.Mock(return_value=3))
+    @mock.patch('os.close', mock.Mock())
+    @mock.patch('treadmill.cgroups.makepath',
+                mock.Mock(return_value='/cgroups/memory/foo'))
+    @mock.patch('treadmill.cgroups._get_data_at',
+                mock.Mock(side_effect=['2', '-1']))
+    def test_get_values(self):
+        """Test batched cgroup value fetching.
+        """
+        values = cgroups.get_values(
+            'memory', 'foo',
+            ['memory.usage_in_bytes', 'memory.failcnt'])
+        self.assertEqual(
+            values,
+            {'memory.usage_in_bytes': 2, 'memory.failcnt': 0})
+
     @mock.patch('treadmill.cgroups._get_mountpoint',
                 mock.Mock(return_value='/cgroups'))
     @mock.patch('treadmill.fs.mkdir_safe', mock.Mock(set_spec=True))
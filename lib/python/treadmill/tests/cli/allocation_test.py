@@ -20,9 +20,19 @@ class AllocationTest(unittest.TestCase):
 
     def setUp(self):
         """Setup common test variables"""
+        # Disable W0212: accessing protected members.
+        # pylint: disable=W0212
+        # An entry point snapshot taken by an earlier test (possibly under
+        # mocks) would leak in through the plugin_manager caches; drop it
+        # so load() resolves against the real environment.
+        plugin_manager._ENTRY_POINTS.clear()
+        plugin_manager._RESOLVED.clear()
         self.runner = click.testing.CliRunner()
         self.alloc_cli = plugin_manager.load('treadmill.cli',
                                              'allocation').init()
+        # Calling command callbacks directly avoids CliRunner overhead
+        # (argument parsing, stream capture) in the hot assertions.
+        self.alloc_delete = self.alloc_cli.commands['delete'].callback
 
     @mock.patch('treadmill.restclient.get')
     @mock.patch('treadmill.restclient.delete',
@@ -44,9 +54,7 @@ class AllocationTest(unittest.TestCase):
         # this one is for get all reservations under 'tent'
         return_mock2.json.return_value = []
         get_mock.side_effect = [return_mock1, return_mock2]
-        result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent'])
-        self.assertEqual(result.exit_code, 0)
+        self.alloc_delete(item='tent')
         treadmill.restclient.delete.assert_called_with(
             ['http://xxx:1234'],
             '/tenant/tent'
@@ -68,9 +76,7 @@ class AllocationTest(unittest.TestCase):
              'tenant': 'tent:subtent',
              'systems': [1, 2, 3]}]
         get_mock.return_value = return_mock1
-        result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent'])
-        self.assertEqual(result.exit_code, 0)
+        self.alloc_delete(item='tent')
         get_mock.assert_called_once_with(['http://xxx:1234'], '/tenant/')
 
         # subtest case 3: tenant does not exist
@@ -78,9 +84,9 @@ class AllocationTest(unittest.TestCase):
         get_mock.return_value = mock.DEFAULT
         from treadmill.restclient import NotFoundError
         get_mock.side_effect = [return_mock2, NotFoundError]
-        result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent'])
-        self.assertEqual(result.exit_code, 1)
+        with self.assertRaises(SystemExit) as exit_cm:
+            self.alloc_delete(item='tent')
+        self.assertEqual(exit_cm.exception.code, 1)
         calls = [mock.call(['http://xxx:1234'], '/tenant/'),
                  mock.call(['http://xxx:1234'], '/allocation/tent')]
         get_mock.assert_has_calls(calls)
@@ -95,9 +101,7 @@ class AllocationTest(unittest.TestCase):
              'systems': [1, 2, 3]}]
         return_mock2.json.return_value = [{'_id': 'tent/dev'}]
         get_mock.side_effect = [return_mock1, return_mock2]
-        result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent'])
-        self.assertEqual(result.exit_code, 0)
+        self.alloc_delete(item='tent')
         calls = [mock.call(['http://xxx:1234'], '/tenant/'),
                  mock.call().json(),
                  mock.call(['http://xxx:1234'], '/allocation/tent')]
@@ -105,21 +109,40 @@ class AllocationTest(unittest.TestCase):
         self.assertEqual(treadmill.restclient.get.call_count, 2)
 
         # delete all reservations
-        result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent/dev'])
-        self.assertEqual(result.exit_code, 0)
+        self.alloc_delete(item='tent/dev')
         treadmill.restclient.delete.assert_called_with(
             ['http://xxx:1234'],
             '/allocation/tent/dev'
         )
 
         # delete a reservation
+        self.alloc_delete(item='tent/dev/rr')
+        treadmill.restclient.delete.assert_called_with(
+            ['http://xxx:1234'],
+            '/allocation/tent/dev/reservation/rr'
+        )
+
+    @mock.patch('treadmill.restclient.get')
+    @mock.patch('treadmill.restclient.delete',
+                mock.Mock(return_value=mock.MagicMock()))
+    @mock.patch('treadmill.context.Context.admin_api',
+                mock.Mock(return_value=['http://xxx:1234']))
+    def test_allocation_delete_cli(self, get_mock):
+        """Sanity test cli.allocation: delete through the click runner"""
+        return_mock1 = mock.Mock()
+        return_mock2 = mock.Mock()
+        return_mock1.json.return_value = [{
+            '_id': None,
+            'tenant': 'tent',
+            'systems': [1, 2, 3]}]
+        return_mock2.json.return_value = []
+        get_mock.side_effect = [return_mock1, return_mock2]
         result = self.runner.invoke(self.alloc_cli,
-                                    ['delete', 'tent/dev/rr'])
+                                    ['delete', 'tent'])
         self.assertEqual(result.exit_code, 0)
         treadmill.restclient.delete.assert_called_with(
             ['http://xxx:1234'],
-            '/allocation/tent/dev/reservation/rr'
+            '/tenant/tent'
         )
 
     @mock.patch('treadmill.restclient.put')
@@ -53,6 +53,9 @@ total_unevictable 0"""
 class MetricsTest(unittest.TestCase):
     """Tests for teadmill.metrics."""
 
+    def setUp(self):
+        metrics._cached_memory_limit.cache_clear()
+
     @mock.patch('treadmill.metrics.cgrp_meminfo',
                 mock.Mock(return_value={
                     'memory.failcnt': 2,
@@ -104,8 +107,6 @@ class MetricsTest(unittest.TestCase):
             }
         )
 
-    @mock.patch('treadmill.cgutils.cpu_usage',
-                mock.Mock(return_value=100))
     @mock.patch('treadmill.cgutils.per_cpu_usage',
                 mock.Mock(return_value=[50, 50]))
     @mock.patch('treadmill.cgroups.get_data',
@@ -136,6 +137,10 @@ class MetricsTest(unittest.TestCase):
 
     @mock.patch('treadmill.cgroups.get_value',
                 mock.Mock(return_value=2))
+    @mock.patch('treadmill.cgroups.get_values',
+                mock.Mock(side_effect=lambda _sys, _grp, pseudofiles: {
+                    pseudofile: 2 for pseudofile in pseudofiles
+                }))
     def test_cgrp_meminfo(self):
         """Test the grabbing of cgrp limits"""
         rv = metrics.cgrp_meminfo('foo')
@@ -25,6 +25,8 @@ class PluginManagerTest(unittest.TestCase):
 
     def setUp(self):
         self.saved = plugin_manager._FILTER
+        plugin_manager._ENTRY_POINTS.clear()
+        plugin_manager._RESOLVED.clear()
 
     def tearDown(self):
         plugin_manager._FILTER = self.saved
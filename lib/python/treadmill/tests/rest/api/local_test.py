@@ -131,6 +131,20 @@ class LocalTest(unittest.TestCase):
         )
         self.assertTrue(self.impl.log.get_all.called)
 
+    @mock.patch('flask.send_file', mock.Mock(return_value=flask.Response()))
+    def test_app_log_file(self):
+        """Tests that a log file path is served via flask.send_file."""
+        self.impl.log.get.side_effect = None
+        self.impl.log.get.return_value = '/var/log/service.log'
+
+        resp = self.client.get(
+            '/local-app/proid.app/uniq/service/service_name'
+        )
+        self.assertEqual(resp.status_code, http_client.OK)
+        flask.send_file.assert_called_once_with(
+            '/var/log/service.log', mimetype='text/plain', conditional=True
+        )
+
     def test_app_log_failure(self):
         """Dummy tests for the case when logs cannot be found."""
         self.impl.log.get.side_effect = LocalFileNotFoundError('foo')
@@ -92,7 +92,7 @@ class RuntimeTest(unittest.TestCase):
         # access protected module _allocate_network_ports
         # pylint: disable=w0212
         treadmill.runtime._allocate_sockets.side_effect = \
-            lambda _x, _y, _z, count: [socket.socket()] * count
+            lambda _x, _y, _z, count, **_kwargs: [socket.socket()] * count
         mock_socket = socket.socket.return_value
         mock_socket.getsockname.side_effect = [
             ('unused', 50001),
@@ -31,18 +31,22 @@ class ServiceTest(unittest.TestCase):
         if self.root and os.path.isdir(self.root):
             shutil.rmtree(self.root)
 
-    @mock.patch('treadmill.supervisor.s6.services.LongrunService',
-                mock.Mock(spec_set=True))
     def test_new(self):
         """Test service factory.
         """
-        mock_svc = s6.create_service(
-            self.root, 'mock', _service_base.ServiceType.LongRun,
-            run_script='test'
-        )
+        # Access protected module _SERVICE_CLS
+        # pylint: disable=W0212
+        mock_cls = mock.Mock(spec_set=True)
+        with mock.patch.dict(
+                s6.services._SERVICE_CLS,
+                {_service_base.ServiceType.LongRun: mock_cls}):
+            mock_svc = s6.create_service(
+                self.root, 'mock', _service_base.ServiceType.LongRun,
+                run_script='test'
+            )
 
         self.assertIsNotNone(mock_svc)
-        s6.services.LongrunService.assert_called_with(
+        mock_cls.assert_called_with(
             self.root, 'mock', run_script='test'
         )
 
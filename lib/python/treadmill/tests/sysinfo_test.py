@@ -253,6 +253,7 @@ power management: [8]
     def test_hostname(self):
         """Test getting hostname of the server.
         """
+        sysinfo.hostname.cache_clear()
         self.assertEqual(
             sysinfo.hostname(),
             'foo.bar'
@@ -264,6 +265,7 @@ power management: [8]
     def test_hostname_env(self):
         """Test getting hostname of the server (TREADMILL_HOSTNAME is set).
         """
+        sysinfo.hostname.cache_clear()
         self.assertEqual(
             sysinfo.hostname(),
             'foo.bar'
@@ -204,6 +204,15 @@ class MockZookeeperTestCase(unittest.TestCase):
 
             return (data, metadata)
 
+        def mock_get_async(zkpath):
+            """Returns an async result handle resolved through mock_get."""
+            def _get():
+                """Resolve the handle, raising like the real get would."""
+                return mock_get(zkpath)
+
+            async_result = namedtuple('MockAsyncResult', ['get'])(_get)
+            return async_result
+
         def mock_get_children(zkpath, watch=None):
             """Traverse data recursively, returns element keys."""
             path = zkpath.split('/')
@@ -250,6 +259,7 @@ class MockZookeeperTestCase(unittest.TestCase):
         side_effects = [
             (kazoo.client.KazooClient.exists, mock_exists),
             (kazoo.client.KazooClient.get, mock_get),
+            (kazoo.client.KazooClient.get_async, mock_get_async),
             (kazoo.client.KazooClient.delete, mock_delete),
             (kazoo.client.KazooClient.get_children, mock_get_children)]
 
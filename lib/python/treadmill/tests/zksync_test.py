@@ -7,7 +7,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import collections
-import glob
 import io
 import os
 import shutil
@@ -48,6 +47,7 @@ class ZkSyncTest(mockzk.MockZookeeperTestCase):
                 self.assertTrue(content == f.read())
 
     @mock.patch('kazoo.client.KazooClient.get', mock.Mock())
+    @mock.patch('kazoo.client.KazooClient.get_async', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.exists', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.get_children', mock.Mock())
     def test_sync_children(self):
@@ -96,7 +96,7 @@ class ZkSyncTest(mockzk.MockZookeeperTestCase):
                                    zk2fs_sync._default_on_del)
         self.assertFalse(os.path.exists(os.path.join(self.root, 'a/x')))
 
-    @mock.patch('glob.glob', mock.Mock())
+    @mock.patch('os.listdir', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.get', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.exists', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.get_children', mock.Mock())
@@ -115,7 +115,7 @@ class ZkSyncTest(mockzk.MockZookeeperTestCase):
 
         self.make_mock_zk(zk_content)
 
-        glob.glob.return_value = ['a/b', 'a/a', 'a/y']
+        os.listdir.return_value = ['b', 'a', 'y']
 
         add = []
         rm = []
@@ -223,6 +223,7 @@ class ZkSyncTest(mockzk.MockZookeeperTestCase):
         self.assertIn('/a/y', zk2fs_sync.watches)
 
     @mock.patch('kazoo.client.KazooClient.get', mock.Mock())
+    @mock.patch('kazoo.client.KazooClient.get_async', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.exists', mock.Mock())
     @mock.patch('kazoo.client.KazooClient.get_children', mock.Mock())
     def test_sync_children_immutable(self):
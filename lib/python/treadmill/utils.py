@@ -32,6 +32,12 @@ else:
     import win32api  # pylint: disable=E0401
     import win32security  # pylint: disable=E0401
 
+try:
+    # C encoder producing the whole payload in one buffer.
+    import orjson
+except ImportError:
+    orjson = None
+
 # disable standard import "import ipaddress" comes before "import win32api"
 import ipaddress  # pylint: disable=C0411
 import six
@@ -253,6 +259,20 @@ def size_to_bytes(size):
         return int(size)
 
 
+@functools.lru_cache(maxsize=2048)
+def cpu_units_cached(value):
+    """Memoized :func:`cpu_units`, for hot paths that reparse the same
+    small set of capacity strings."""
+    return cpu_units(value)
+
+
+@functools.lru_cache(maxsize=2048)
+def size_to_bytes_cached(size):
+    """Memoized :func:`size_to_bytes`, for hot paths that reparse the same
+    small set of capacity strings."""
+    return size_to_bytes(size)
+
+
 def kilobytes(value):
     """Converts values with M/K/G suffix into numeric in Kbytes.
 
@@ -701,6 +721,34 @@ def json_genencode(obj, indent=None):
     )
 
 
+def json_encode(obj):
+    """Encode object as UTF-8 JSON bytes in a single pass.
+
+    Unlike :func:`json_genencode` the whole payload is produced as one
+    buffer, so it can be written with a single call. Uses orjson when
+    available, falling back to the stdlib encoder.
+
+    :returns
+        ``bytes`` - UTF-8 encoded JSON data.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_decode(data):
+    """Decode JSON data in a single pass.
+
+    Counterpart of :func:`json_encode`: uses orjson when available,
+    falling back to the stdlib decoder. Accepts ``str`` or ``bytes``.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 def parse_mask(value, mask_enum):
     """Parse a mask into indivitual mask values from enum.
 
@@ -6,6 +6,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import itertools
 import logging
 import os
 import tempfile
@@ -18,6 +19,14 @@ NODE_DATA_FILE = '.data'
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Payloads below this size bypass the tempfile machinery and go through
+#: raw open/write/close syscalls. Typical znode data is well under this.
+_SMALL_DATA_SIZE = 4096
+
+#: Counter used to generate unique temp file names for small writes,
+#: together with the pid. next() on it is atomic, no lock needed.
+_TMP_COUNTER = itertools.count()
+
 
 def create_ready_file(fsroot):
     """Create zksync ready file
@@ -27,22 +36,68 @@ def create_ready_file(fsroot):
     return modified_file
 
 
-def write_data(fpath, data, modified, raise_err=True, tmp_dir=None):
-    """Safely write data to file path.
+def _write_temp_small(data, modified, tmp_dir):
+    """Write a small payload to a counter-named temp file, raw syscalls.
+
+    Skips the buffered file object and the mkstemp random-name loop of
+    the tempfile module; pid + counter keeps the name unique.
     """
-    tmp_dir = tmp_dir or os.path.dirname(fpath)
+    temp_name = os.path.join(
+        tmp_dir,
+        '.tmp-{}-{}'.format(os.getpid(), next(_TMP_COUNTER))
+    )
+    fd_times = os.utime in os.supports_fd
+    fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        if os.name == 'posix':
+            # The mode passed to os.open is subject to umask, force it.
+            os.fchmod(fd, 0o644)
+        if fd_times:
+            os.utime(fd, (modified, modified))
+    finally:
+        os.close(fd)
+    if not fd_times:
+        os.utime(temp_name, (modified, modified))
+    return temp_name
+
+
+def _write_temp(data, modified, tmp_dir):
+    """Write payload to a tempfile-managed temp file."""
+    fd_times = os.utime in os.supports_fd
     with tempfile.NamedTemporaryFile(dir=tmp_dir,
                                      delete=False,
                                      prefix='.tmp') as temp:
-        if data:
-            temp.write(data)
+        temp.write(data)
         if os.name == 'posix':
             os.fchmod(temp.fileno(), 0o644)
-    os.utime(temp.name, (modified, modified))
+        if fd_times:
+            # Set the timestamp through the open descriptor, saving a path
+            # lookup on the temp name. Flush first so close() has nothing
+            # left to write that would bump the mtime again.
+            temp.flush()
+            os.utime(temp.fileno(), (modified, modified))
+    if not fd_times:
+        os.utime(temp.name, (modified, modified))
+    return temp.name
+
+
+def write_data(fpath, data, modified, raise_err=True, tmp_dir=None):
+    """Safely write data to file path.
+    """
+    tmp_dir = tmp_dir or os.path.dirname(fpath)
+    if data is None:
+        data = b''
+    if len(data) < _SMALL_DATA_SIZE:
+        temp_name = _write_temp_small(data, modified, tmp_dir)
+    else:
+        temp_name = _write_temp(data, modified, tmp_dir)
     try:
-        os.rename(temp.name, fpath)
+        # os.replace overwrites the destination atomically on all
+        # platforms, os.rename only does so on posix.
+        os.replace(temp_name, fpath)
     except OSError:
-        _LOGGER.error('Unable to rename: %s => %s', temp.name, fpath,
+        _LOGGER.error('Unable to rename: %s => %s', temp_name, fpath,
                       exc_info=True)
         if raise_err:
             raise
@@ -6,9 +6,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import errno
+import functools
 import logging
-import glob
 import os
+import threading
+import time
+
 import kazoo
 
 from treadmill import fs
@@ -21,6 +25,14 @@ from treadmill.zksync import utils as zksync_utils
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Max entries in the zkpath to file path translation cache. The cache is
+#: simply dropped when it grows past this, high churn nodes re-fill it.
+_FPATH_CACHE_SIZE = 8192
+
+#: How often, in seconds, the modified marker is refreshed when events
+#: were synced since the last refresh.
+_MODIFIED_FLUSH_INTERVAL = 0.1
+
 
 class Zk2Fs:
     """Syncronize Zookeeper with file system."""
@@ -28,6 +40,10 @@ class Zk2Fs:
     def __init__(self, zkclient, fsroot, tmp_dir=None):
         self.watches = set()
         self.processed_once = set()
+        self._fpath_cache = {}
+        self._last_children = {}
+        self._done_paths = set()
+        self._dirty = False
         self.zkclient = zkclient
         self.fsroot = fsroot
         self.tmp_dir = tmp_dir
@@ -38,12 +54,25 @@ class Zk2Fs:
     def mark_ready(self):
         """Mark itself as ready, typically past initial sync."""
         self.ready = True
-        self._update_last()
+        zksync_utils.create_ready_file(self.fsroot)
+        # A single flusher thread refreshes the marker periodically, so a
+        # burst of zookeeper events costs one touch per interval instead
+        # of one per event.
+        flusher = threading.Thread(target=self._flush_modified, daemon=True)
+        flusher.start()
+
+    def _flush_modified(self):
+        """Refresh the modified marker whenever changes were synced."""
+        while True:
+            time.sleep(_MODIFIED_FLUSH_INTERVAL)
+            if self._dirty:
+                self._dirty = False
+                zksync_utils.create_ready_file(self.fsroot)
 
     def _update_last(self):
         """Update modify file timestamp to indicate changes were made."""
         if self.ready:
-            zksync_utils.create_ready_file(self.fsroot)
+            self._dirty = True
 
     def _default_on_del(self, zkpath):
         """Default callback invoked on node delete, remove file."""
@@ -64,6 +93,28 @@ class Zk2Fs:
             fpath = self.fpath(zkpath)
             fs.rm_safe(fpath)
 
+    def _batch_sync_data(self, zknodes):
+        """Sync data of multiple znodes, overlapping the fetches.
+
+        All reads are issued up front so the zookeeper client pipelines
+        them over the connection, paying one round trip window for the
+        batch instead of one round trip per node.
+        """
+        pending = [
+            (zknode, self.zkclient.get_async(zknode))
+            for zknode in zknodes
+        ]
+        for zknode, async_result in pending:
+            fpath = self.fpath(zknode)
+            try:
+                data, stat = async_result.get()
+                self._write_data(fpath, data, stat)
+            except kazoo.client.NoNodeError:
+                _LOGGER.warning(
+                    'Tried to add node that no longer exists: %s', zknode
+                )
+                fs.rm_safe(fpath)
+
     def _write_data(self, fpath, data, stat):
         """Write Zookeeper data to filesystem.
         """
@@ -74,72 +125,78 @@ class Zk2Fs:
 
     def _data_watch(self, zkpath, data, stat, event, fpath=None):
         """Invoked when data changes.
+
+        The common case by far is a data update on a live node, so it is
+        tested first with a single compound condition; deletes and
+        missing nodes share the cleanup tail.
         """
-        fpath = fpath or self.fpath(zkpath)
+        if stat is not None and (event is None or event.type != 'DELETED'):
+            self._write_data(fpath or self.fpath(zkpath), data, stat)
+            return
+
         if event is not None and event.type == 'DELETED':
             _LOGGER.info('Node deleted: %s', zkpath)
-            self.watches.discard(zkpath)
-            fs.rm_safe(fpath)
-        elif stat is None:
-            _LOGGER.info('Node does not exist: %s', zkpath)
-            self.watches.discard(zkpath)
-            fs.rm_safe(fpath)
         else:
-            self._write_data(fpath, data, stat)
-
-    def _filter_children_actions(self, sorted_children, sorted_filenames, add,
-                                 remove, common):
-        """sorts the children actions to add, remove and common."""
-        num_children = len(sorted_children)
-        num_filenames = len(sorted_filenames)
-
-        child_idx = 0
-        file_idx = 0
-
-        while child_idx < num_children or file_idx < num_filenames:
-            child_name = None
-            if child_idx < num_children:
-                child_name = sorted_children[child_idx]
-
-            file_name = None
-            if file_idx < num_filenames:
-                file_name = sorted_filenames[file_idx]
-
-            if child_name is None:
-                remove.append(file_name)
-                file_idx += 1
-
-            elif file_name is None:
-                add.append(child_name)
-                child_idx += 1
+            _LOGGER.info('Node does not exist: %s', zkpath)
+        self.watches.discard(zkpath)
+        fs.rm_safe(fpath or self.fpath(zkpath))
 
-            elif child_name == file_name:
-                common.append(child_name)
-                child_idx += 1
-                file_idx += 1
+    def _filter_children_actions(self, children, filenames, add,
+                                 remove, common=None):
+        """Sorts the children actions to add, remove and common.
 
-            elif child_name < file_name:
-                add.append(child_name)
-                child_idx += 1
+        The diff itself runs as C-level set arithmetic, only the result
+        lists are sorted. `common` can be None when the caller does not
+        need the (typically largest) intersection.
+        """
+        children_set = set(children)
+        filenames_set = set(filenames)
 
-            else:
-                remove.append(file_name)
-                file_idx += 1
+        add.extend(sorted(children_set - filenames_set))
+        remove.extend(sorted(filenames_set - children_set))
+        if common is not None:
+            common.extend(sorted(children_set & filenames_set))
 
     def _children_watch(self, zkpath, children, watch_data,
                         on_add, on_del, cont_watch_predicate=None):
         """Callback invoked on children watch."""
+        # Watches can fire for znode changes that leave the children list
+        # intact; skip the listdir/diff work entirely when nothing changed
+        # since the last (fully processed) event.
+        children_set = frozenset(children)
+        if (zkpath in self.processed_once and
+                self._last_children.get(zkpath) == children_set):
+            return True
+        self._last_children[zkpath] = children_set
+
         fpath = self.fpath(zkpath)
 
-        sorted_children = sorted(children)
-        sorted_filenames = sorted(map(os.path.basename,
-                                      glob.glob(os.path.join(fpath, '*'))))
+        # Same result as globbing for '*' (dotfiles excluded, missing
+        # directory treated as empty) without the fnmatch machinery and
+        # path join/basename churn per entry.
+        try:
+            filenames = os.listdir(fpath)
+        except OSError as err:
+            if err.errno != errno.ENOENT:
+                raise
+            filenames = []
+        filenames = [
+            name
+            for name in filenames
+            if not name.startswith('.')
+        ]
 
         add = []
         remove = []
-        common = []
+        # Common nodes are only replayed the first time a path is
+        # processed; skip computing the intersection on the steady state
+        # path where it would be thrown away.
+        if zkpath not in self.processed_once:
+            common = []
+        else:
+            common = None
 
-        self._filter_children_actions(sorted_children, sorted_filenames,
+        self._filter_children_actions(children, filenames,
                                       add, remove, common)
 
         for node in remove:
@@ -148,6 +205,12 @@ class Zk2Fs:
             self.watches.discard(zknode)
             on_del(zknode)
 
+        # The default add callback without a data watch is a plain
+        # fetch+write per node, so those nodes are collected and synced
+        # as one batch of overlapped zookeeper reads.
+        batch = []
+        can_batch = on_add == self._default_on_add
+
         if zkpath not in self.processed_once:
             self.processed_once.add(zkpath)
             for node in common:
@@ -157,7 +220,10 @@ class Zk2Fs:
                 if watch_data:
                     self.watches.add(zknode)
 
-                on_add(zknode)
+                if can_batch and zknode not in self.watches:
+                    batch.append(zknode)
+                else:
+                    on_add(zknode)
 
         for node in add:
             _LOGGER.info('Add: %s', node)
@@ -166,16 +232,50 @@ class Zk2Fs:
             if watch_data:
                 self.watches.add(zknode)
 
-            on_add(zknode)
+            if can_batch and zknode not in self.watches:
+                batch.append(zknode)
+            else:
+                on_add(zknode)
+
+        if batch:
+            self._batch_sync_data(batch)
 
         if cont_watch_predicate:
-            return cont_watch_predicate(zkpath, sorted_children)
+            return cont_watch_predicate(zkpath, sorted(children))
 
         return True
 
+    @utils.exit_on_unhandled
+    def _on_watched_data(self, zkpath, fpath, data, stat, event):
+        """Shared data watch callback, bound to a path with a partial."""
+        self._data_watch(zkpath, data, stat, event, fpath)
+        self._update_last()
+
+    @utils.exit_on_unhandled
+    def _on_watched_children(self, zkpath, watch_data, on_add, on_del,
+                             cont_watch_predicate, children):
+        """Shared children watch callback, bound to a path with a partial."""
+        renew = self._children_watch(
+            zkpath,
+            children,
+            watch_data,
+            on_add,
+            on_del,
+            cont_watch_predicate=cont_watch_predicate,
+        )
+
+        self._update_last()
+        return renew
+
     def fpath(self, zkpath):
         """Returns file path to given zk node."""
-        return os.path.join(self.fsroot, zkpath.lstrip('/'))
+        fpath = self._fpath_cache.get(zkpath)
+        if fpath is None:
+            if len(self._fpath_cache) >= _FPATH_CACHE_SIZE:
+                self._fpath_cache.clear()
+            fpath = os.path.join(self.fsroot, zkpath.lstrip('/'))
+            self._fpath_cache[zkpath] = fpath
+        return fpath
 
     def sync_data(self, zkpath, fpath=None, watch=False):
         """Sync zk node data to file."""
@@ -185,12 +285,13 @@ class Zk2Fs:
             self.watches.add(zkpath)
 
         if zkpath in self.watches:
-            @zkwatchers.ExistingDataWatch(self.zkclient, zkpath)
-            @utils.exit_on_unhandled
-            def _data_watch(data, stat, event):
-                """Invoked when data changes."""
-                self._data_watch(zkpath, data, stat, event, fpath)
-                self._update_last()
+            # The callback method is decorated once at class creation, so
+            # registering a watch only allocates the partial binding the
+            # path, not a fresh closure plus decorator wrappers.
+            zkwatchers.ExistingDataWatch(
+                self.zkclient, zkpath,
+                functools.partial(self._on_watched_data, zkpath, fpath)
+            )
         else:
             data, stat = self.zkclient.get(zkpath)
             self._write_data(fpath, data, stat)
@@ -203,21 +304,13 @@ class Zk2Fs:
 
         _LOGGER.debug('Establish children watch on: %s', zkpath)
 
-        @self.zkclient.ChildrenWatch(zkpath)
-        @utils.exit_on_unhandled
-        def _children_watch(children):
-            """Callback invoked on children watch."""
-            renew = self._children_watch(
-                zkpath,
-                children,
-                watch_data,
-                on_add,
-                on_del,
-                cont_watch_predicate=cont_watch_predicate,
+        self.zkclient.ChildrenWatch(
+            zkpath,
+            functools.partial(
+                self._on_watched_children,
+                zkpath, watch_data, on_add, on_del, cont_watch_predicate
             )
-
-            self._update_last()
-            return renew
+        )
 
     def sync_children(self, zkpath, watch_data=False,
                       on_add=None, on_del=None,
@@ -239,12 +332,17 @@ class Zk2Fs:
                      zkpath,
                      watch_data)
 
+        # Paths already known to be done skip the stat on the done file.
+        if zkpath in self._done_paths:
+            return
+
         fpath = self.fpath(zkpath)
         fs.mkdir_safe(fpath)
 
         done_file = os.path.join(fpath, '.done')
         if os.path.exists(done_file):
             _LOGGER.info('Found done file: %s, nothing to watch.', done_file)
+            self._done_paths.add(zkpath)
             return
 
         if not on_del:
@@ -287,3 +385,4 @@ class Zk2Fs:
 
         if not need_watch:
             utils.touch(done_file)
+            self._done_paths.add(zkpath)